@@ -1,23 +1,46 @@
 import sys
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
+from typing import Optional
+from PySide6.QtWidgets import QApplication, QStyleFactory
+from PySide6.QtGui import QPixmapCache
 
 # ---------------------------------------------------
 #  Project Root Setup
 # ---------------------------------------------------
-ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT))
+# Installed (`pip install -e .` -> `qrs-tweaks`) or `python -m app.main`
+# already has the project on sys.path. Only the plain
+# `python app/main.py` script launch needs the root added.
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Optional QSS theme
-QSS_PATH = ROOT / "app" / "qdark.qss"
+QSS_PATH = Path(__file__).with_name("qdark.qss")
+_QSS_CACHE: Optional[str] = None
+
+
+def _load_qss() -> str:
+    """Read qdark.qss once per process; later calls reuse the cached text."""
+    global _QSS_CACHE
+    if _QSS_CACHE is None:
+        try:
+            _QSS_CACHE = QSS_PATH.read_text(encoding="utf-8")
+        except OSError:
+            _QSS_CACHE = ""
+    return _QSS_CACHE
 
 
 def main():
     app = QApplication(sys.argv)
 
+    # One base style for every widget, so control pixmaps are rendered
+    # once and shared through a larger pixmap cache (KB).
+    app.setStyle(QStyleFactory.create("Fusion"))
+    QPixmapCache.setCacheLimit(10240)
+
     # Load external stylesheet if present
-    if QSS_PATH.exists():
-        app.setStyleSheet(QSS_PATH.read_text(encoding="utf-8"))
+    qss = _load_qss()
+    if qss:
+        app.setStyleSheet(qss)
 
     # Import after QApplication (PySide6 requirement)
     from app.ui.suite_window import SuiteWindow
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -16,30 +16,90 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QTimer
 
 from app.ui.widgets.card import Card
-from src.qrs.modules.telemetry import Telemetry
+from app.ui.styles import TRANSPARENT_CSS, PAGE_TITLE_CSS
+from src.qrs.modules.services import get_telemetry
+
+
+# Page-wide stylesheet, installed once on the scroll container. Bars and
+# labels only carry an objectName; Qt parses this sheet a single time
+# and matches by selector instead of parsing a copy per widget.
+_DASHBOARD_QSS = """
+QProgressBar#coreBar, QProgressBar#ramBar {
+    border: 1px solid #2b2f3b;
+    border-radius: 4px;
+    background: #151821;
+    color: #DDE1EA;
+    text-align: center;
+    padding: 1px;
+    min-height: 18px;
+}
+QProgressBar#ramBar {
+    min-height: 20px;
+}
+QProgressBar#coreBar::chunk {
+    border-radius: 4px;
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:0,
+        stop:0 #5f4bff,
+        stop:1 #ff3cac
+    );
+}
+QProgressBar#ramBar::chunk {
+    border-radius: 4px;
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:0,
+        stop:0 #21d4fd,
+        stop:1 #b721ff
+    );
+}
+QLabel#cpuTotal {
+    font-size: 16pt;
+    color: #F2F5FF;
+}
+QLabel#valueLabel {
+    color: #DDE1EA;
+    font-size: 10pt;
+}
+QLabel#metaLabel {
+    color: #AAB0BC;
+    font-size: 9pt;
+}
+"""
+
+_GIB = 1.0 / (1024 ** 3)
+
+# (row, col) for core bar i in the two-column grid
+_POS_2COL = [(i >> 1, i & 1) for i in range(256)]
+
+
+def _core_pos(index: int) -> tuple:
+    if index < 256:
+        return _POS_2COL[index]
+    return index >> 1, index & 1
 
 
 def _format_gib(bytes_value: int) -> str:
-    if bytes_value <= 0:
-        return "0.0 GiB"
-    return f"{bytes_value / (1024 ** 3):.1f} GiB"
+    return f"{bytes_value * _GIB:.1f} GiB" if bytes_value > 0 else "0.0 GiB"
 
 
 def _format_uptime(seconds: float) -> str:
-    seconds = max(0.0, float(seconds))
-    days = int(seconds // 86400)
-    seconds %= 86400
-    hours = int(seconds // 3600)
-    seconds %= 3600
-    minutes = int(seconds // 60)
-
-    parts = []
+    s = int(seconds) if seconds > 0 else 0
+    days, s = divmod(s, 86400)
+    hours, s = divmod(s, 3600)
+    minutes = s // 60
+
     if days:
-        parts.append(f"{days}d")
-    if hours or days:
-        parts.append(f"{hours}h")
-    parts.append(f"{minutes}m")
-    return " ".join(parts)
+        return f"{days}d {hours}h {minutes}m"
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+def _make_label(text: str, name: str) -> QLabel:
+    """Label styled by _DASHBOARD_QSS through its objectName."""
+    lbl = QLabel(text)
+    lbl.setObjectName(name)
+    return lbl
 
 
 class DashboardPage(QWidget):
@@ -55,17 +115,23 @@ class DashboardPage(QWidget):
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(TRANSPARENT_CSS)
 
-        self.telemetry = Telemetry()
+        self.telemetry = get_telemetry()
         initial = self.telemetry.snapshot()
-        self._initial_cpu_cores = len(initial.get("cpu_per_core") or [])
+        self._initial_cpu_cores = len(initial.cpu_per_core)
 
         if self._initial_cpu_cores <= 0:
             # Reasonable default – will be resized once real data arrives
             self._initial_cpu_cores = 4
 
         self._core_bars: List[QProgressBar] = []
+        # Bars hidden after a core-count drop, reused if it grows again
+        self._spare_bars: List[QProgressBar] = []
+
+        # Last values pushed to each widget; used to skip no-op repaints
+        self._last: Dict[QWidget, object] = {}
+        self._last_cores: List[int] = []
 
         # -------------------------------------------------
         # Scroll wrapper (match WindowsPage / GamesPage)
@@ -75,9 +141,10 @@ class DashboardPage(QWidget):
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll.setFrameShape(QScrollArea.NoFrame)
-        scroll.setStyleSheet("background: transparent;")
+        scroll.setStyleSheet(TRANSPARENT_CSS)
 
         container = QWidget()
+        container.setStyleSheet(_DASHBOARD_QSS)
         scroll.setWidget(container)
 
         root = QVBoxLayout(container)
@@ -88,7 +155,7 @@ class DashboardPage(QWidget):
         # Title
         # -------------------------------------------------
         title = QLabel("System Dashboard")
-        title.setStyleSheet("font-size: 22pt; color: #DDE1EA; font-weight: 700;")
+        title.setStyleSheet(PAGE_TITLE_CSS)
         root.addWidget(title)
 
         # -------------------------------------------------
@@ -97,52 +164,26 @@ class DashboardPage(QWidget):
         cpu_card = Card("CPU Usage")
         cpu_body = cpu_card.body()
 
-        self.lbl_cpu_total = QLabel("CPU: -- %")
-        self.lbl_cpu_total.setStyleSheet("font-size: 16pt; color: #F2F5FF;")
+        self.lbl_cpu_total = _make_label("CPU: -- %", "cpuTotal")
         cpu_body.addWidget(self.lbl_cpu_total)
 
-        self.lbl_cpu_meta = QLabel("Cores: -- | Processes: --")
-        self.lbl_cpu_meta.setStyleSheet("color:#AAB0BC; font-size: 9pt;")
+        self.lbl_cpu_meta = _make_label("Cores: -- | Processes: --", "metaLabel")
         cpu_body.addWidget(self.lbl_cpu_meta)
 
         grid = QGridLayout()
         grid.setSpacing(6)
 
         for i in range(self._initial_cpu_cores):
-            bar = QProgressBar()
-            bar.setRange(0, 100)
-            bar.setValue(0)
-            bar.setFormat(f"Core {i}  %p%")
-            bar.setAlignment(Qt.AlignCenter)
-            bar.setStyleSheet(
-                """
-                QProgressBar {
-                    border: 1px solid #2b2f3b;
-                    border-radius: 4px;
-                    background: #151821;
-                    color: #DDE1EA;
-                    text-align: center;
-                    padding: 1px;
-                    min-height: 18px;
-                }
-                QProgressBar::chunk {
-                    border-radius: 4px;
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #5f4bff,
-                        stop:1 #ff3cac
-                    );
-                }
-                """
-            )
+            bar = self._make_core_bar(i)
             self._core_bars.append(bar)
-            row = i // 2
-            col = i % 2
-            grid.addWidget(bar, row, col)
+            grid.addWidget(bar, *_core_pos(i))
 
         cpu_body.addLayout(grid)
         root.addWidget(cpu_card)
 
+        # Direct reference for _rebuild_cpu_bars (no findChild walks)
+        self._cpu_grid_layout = grid
+
         # -------------------------------------------------
         # MEMORY CARD
         # -------------------------------------------------
@@ -152,8 +193,7 @@ class DashboardPage(QWidget):
         row_mem = QHBoxLayout()
         row_mem.setSpacing(12)
 
-        self.lbl_ram_summary = QLabel("RAM: -- / -- (--)")
-        self.lbl_ram_summary.setStyleSheet("color:#DDE1EA; font-size: 10pt;")
+        self.lbl_ram_summary = _make_label("RAM: -- / -- (--)", "valueLabel")
 
         row_mem.addWidget(self.lbl_ram_summary)
         row_mem.addStretch()
@@ -165,27 +205,7 @@ class DashboardPage(QWidget):
         self.bar_ram.setValue(0)
         self.bar_ram.setFormat("%p%")
         self.bar_ram.setAlignment(Qt.AlignCenter)
-        self.bar_ram.setStyleSheet(
-            """
-            QProgressBar {
-                border: 1px solid #2b2f3b;
-                border-radius: 4px;
-                background: #151821;
-                color: #DDE1EA;
-                text-align: center;
-                padding: 1px;
-                min-height: 20px;
-            }
-            QProgressBar::chunk {
-                border-radius: 4px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #21d4fd,
-                    stop:1 #b721ff
-                );
-            }
-            """
-        )
+        self.bar_ram.setObjectName("ramBar")
         mem_body.addWidget(self.bar_ram)
 
         root.addWidget(mem_card)
@@ -200,12 +220,9 @@ class DashboardPage(QWidget):
         gpu_card = Card("GPU (best effort)")
         gpu_body = gpu_card.body()
 
-        self.lbl_gpu_usage = QLabel("GPU: -- %")
-        self.lbl_gpu_usage.setStyleSheet("color:#DDE1EA; font-size: 10pt;")
-        self.lbl_gpu_mem = QLabel("VRAM: -- / --")
-        self.lbl_gpu_mem.setStyleSheet("color:#AAB0BC; font-size: 9pt;")
-        self.lbl_gpu_temp = QLabel("Temp: -- °C")
-        self.lbl_gpu_temp.setStyleSheet("color:#AAB0BC; font-size: 9pt;")
+        self.lbl_gpu_usage = _make_label("GPU: -- %", "valueLabel")
+        self.lbl_gpu_mem = _make_label("VRAM: -- / --", "metaLabel")
+        self.lbl_gpu_temp = _make_label("Temp: -- °C", "metaLabel")
 
         gpu_body.addWidget(self.lbl_gpu_usage)
         gpu_body.addWidget(self.lbl_gpu_mem)
@@ -217,10 +234,8 @@ class DashboardPage(QWidget):
         sys_card = Card("System")
         sys_body = sys_card.body()
 
-        self.lbl_uptime = QLabel("Uptime: --")
-        self.lbl_uptime.setStyleSheet("color:#DDE1EA; font-size: 10pt;")
-        self.lbl_proc_count = QLabel("Processes: --")
-        self.lbl_proc_count.setStyleSheet("color:#AAB0BC; font-size: 9pt;")
+        self.lbl_uptime = _make_label("Uptime: --", "valueLabel")
+        self.lbl_proc_count = _make_label("Processes: --", "metaLabel")
 
         sys_body.addWidget(self.lbl_uptime)
         sys_body.addWidget(self.lbl_proc_count)
@@ -239,38 +254,60 @@ class DashboardPage(QWidget):
         layout.addWidget(scroll)
 
         # Timer for updates (bar-flow style)
+        # Coarse timer, and only running while the page is visible
+        # (see showEvent / hideEvent)
         self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.CoarseTimer)
         self._timer.setInterval(500)  # 500ms
         self._timer.timeout.connect(self._update_telemetry)
-        self._timer.start()
 
-        # One immediate refresh
+    # -------------------------------------------------
+    # VISIBILITY: no polling while another page is shown
+    # -------------------------------------------------
+    def showEvent(self, event) -> None:
+        # Refresh right away so the page is never stale when switched to
         self._update_telemetry()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self._timer.stop()
+        super().hideEvent(event)
 
     # -------------------------------------------------
     # UPDATE LOOP
     # -------------------------------------------------
+    def _set_text(self, label: QLabel, text: str) -> None:
+        if self._last.get(label) != text:
+            label.setText(text)
+            self._last[label] = text
+
+    def _set_value(self, bar: QProgressBar, value: int) -> None:
+        if self._last.get(bar) != value:
+            bar.setValue(value)
+            self._last[bar] = value
+
     def _update_telemetry(self) -> None:
         data = self.telemetry.snapshot()
 
-        if not data.get("supported", False):
-            self.lbl_cpu_total.setText("CPU: telemetry not available")
-            self.lbl_cpu_meta.setText("psutil missing or unsupported platform.")
-            self.lbl_ram_summary.setText("RAM: telemetry not available")
-            self.bar_ram.setValue(0)
-            self.lbl_uptime.setText("Uptime: --")
-            self.lbl_proc_count.setText("Processes: --")
-            self.lbl_gpu_usage.setText("GPU: -- (optional)")
-            self.lbl_gpu_mem.setText("VRAM: -- / --")
-            self.lbl_gpu_temp.setText("Temp: -- °C")
+        if not data.supported:
+            self._set_text(self.lbl_cpu_total, "CPU: telemetry not available")
+            self._set_text(self.lbl_cpu_meta, "psutil missing or unsupported platform.")
+            self._set_text(self.lbl_ram_summary, "RAM: telemetry not available")
+            self._set_value(self.bar_ram, 0)
+            self._set_text(self.lbl_uptime, "Uptime: --")
+            self._set_text(self.lbl_proc_count, "Processes: --")
+            self._set_text(self.lbl_gpu_usage, "GPU: -- (optional)")
+            self._set_text(self.lbl_gpu_mem, "VRAM: -- / --")
+            self._set_text(self.lbl_gpu_temp, "Temp: -- °C")
             return
 
         # CPU
-        cpu_total = float(data.get("cpu_total", 0.0))
-        per_core = list(data.get("cpu_per_core") or [])
-        proc_count = int(data.get("process_count", 0))
+        cpu_total = data.cpu_total
+        per_core = data.cpu_per_core
+        proc_count = data.process_count
 
-        self.lbl_cpu_total.setText(f"CPU: {cpu_total:.1f} %")
+        self._set_text(self.lbl_cpu_total, f"CPU: {cpu_total:.1f} %")
 
         core_count = len(per_core)
         if core_count and core_count != len(self._core_bars):
@@ -278,125 +315,99 @@ class DashboardPage(QWidget):
             self._rebuild_cpu_bars(core_count)
             # fall through to use updated list
 
+        last_cores = self._last_cores
+        if len(last_cores) != len(self._core_bars):
+            last_cores[:] = [-1] * len(self._core_bars)
+
         for i, bar in enumerate(self._core_bars):
             value = int(per_core[i]) if i < len(per_core) else 0
-            bar.setValue(max(0, min(100, value)))
-
-        self.lbl_cpu_meta.setText(
-            f"Cores: {core_count or '--'} | Processes: {proc_count or '--'}"
+            value = max(0, min(100, value))
+            if last_cores[i] != value:
+                bar.setValue(value)
+                last_cores[i] = value
+
+        self._set_text(
+            self.lbl_cpu_meta,
+            f"Cores: {core_count or '--'} | Processes: {proc_count or '--'}",
         )
 
         # RAM
-        ram_used = int(data.get("ram_used", 0))
-        ram_total = int(data.get("ram_total", 0))
-        ram_percent = float(data.get("ram_percent", 0.0))
-
-        self.bar_ram.setValue(int(ram_percent))
-        self.lbl_ram_summary.setText(
-            f"RAM: {_format_gib(ram_used)} / {_format_gib(ram_total)} ({ram_percent:.1f}%)"
+        ram_used = data.ram_used
+        ram_total = data.ram_total
+        ram_percent = data.ram_percent
+
+        self._set_value(self.bar_ram, int(ram_percent))
+        self._set_text(
+            self.lbl_ram_summary,
+            f"RAM: {_format_gib(ram_used)} / {_format_gib(ram_total)} ({ram_percent:.1f}%)",
         )
 
         # System
-        uptime = float(data.get("uptime_sec", 0.0))
-        self.lbl_uptime.setText(f"Uptime: {_format_uptime(uptime)}")
-        self.lbl_proc_count.setText(f"Processes: {proc_count}")
+        uptime = data.uptime_sec
+        self._set_text(self.lbl_uptime, f"Uptime: {_format_uptime(uptime)}")
+        self._set_text(self.lbl_proc_count, f"Processes: {proc_count}")
 
         # GPU
-        gpu_usage = data.get("gpu_usage")
-        gpu_temp = data.get("gpu_temp")
-        gpu_mem_used = data.get("gpu_mem_used")
-        gpu_mem_total = data.get("gpu_mem_total")
+        gpu_usage = data.gpu_usage
+        gpu_temp = data.gpu_temp
+        gpu_mem_used = data.gpu_mem_used
+        gpu_mem_total = data.gpu_mem_total
 
         if gpu_usage is None:
-            self.lbl_gpu_usage.setText("GPU: n/a (GPUtil not installed)")
+            self._set_text(self.lbl_gpu_usage, "GPU: n/a (GPUtil not installed)")
         else:
-            self.lbl_gpu_usage.setText(f"GPU: {gpu_usage:.1f} %")
+            self._set_text(self.lbl_gpu_usage, f"GPU: {gpu_usage:.1f} %")
 
         if gpu_mem_used is None or gpu_mem_total is None or gpu_mem_total == 0:
-            self.lbl_gpu_mem.setText("VRAM: -- / --")
+            self._set_text(self.lbl_gpu_mem, "VRAM: -- / --")
         else:
-            self.lbl_gpu_mem.setText(
-                f"VRAM: {gpu_mem_used:.1f} / {gpu_mem_total:.1f} GiB"
+            self._set_text(
+                self.lbl_gpu_mem,
+                f"VRAM: {gpu_mem_used:.1f} / {gpu_mem_total:.1f} GiB",
             )
 
         if gpu_temp is None or gpu_temp <= 0:
-            self.lbl_gpu_temp.setText("Temp: -- °C")
+            self._set_text(self.lbl_gpu_temp, "Temp: -- °C")
         else:
-            self.lbl_gpu_temp.setText(f"Temp: {gpu_temp:.0f} °C")
+            self._set_text(self.lbl_gpu_temp, f"Temp: {gpu_temp:.0f} °C")
 
     # -------------------------------------------------
-    # INTERNAL: rebuild CPU bars if core-count changes
+    # INTERNAL: resize CPU bars if core-count changes
     # -------------------------------------------------
+    @staticmethod
+    def _make_core_bar(index: int) -> QProgressBar:
+        bar = QProgressBar()
+        bar.setRange(0, 100)
+        bar.setValue(0)
+        bar.setFormat(f"Core {index}  %p%")
+        bar.setAlignment(Qt.AlignCenter)
+        bar.setObjectName("coreBar")
+        return bar
+
     def _rebuild_cpu_bars(self, core_count: int) -> None:
-        # Find the grid layout inside the CPU card body
-        # (we know the structure: title, meta, grid)
-        scroll = self.findChild(QScrollArea)
-        if not scroll:
-            return
-        container = scroll.widget()
-        if not container:
-            return
-        root: QVBoxLayout = container.layout()  # type: ignore[assignment]
-        if root is None:
-            return
+        grid = self._cpu_grid_layout
+        bars = self._core_bars
+        current = len(bars)
 
-        # CPU card is the second widget (title, then CPU card)
-        # but safer to search by type Card
-        cpu_card = container.findChild(Card, None)
-        if cpu_card is None:
+        if core_count == current:
             return
 
-        cpu_body_layout = cpu_card.body()
-        # Layout children: [lbl_cpu_total, lbl_cpu_meta, grid]
-        # We replace the last item (grid) with a new grid.
-        if cpu_body_layout.count() < 3:
+        if core_count > current:
+            for i in range(current, core_count):
+                if self._spare_bars:
+                    bar = self._spare_bars.pop()
+                    bar.setFormat(f"Core {i}  %p%")
+                    bar.setValue(0)
+                else:
+                    bar = self._make_core_bar(i)
+                bars.append(bar)
+                grid.addWidget(bar, *_core_pos(i))
+                bar.show()
             return
 
-        old_item = cpu_body_layout.itemAt(2)
-        old_layout = old_item.layout() if old_item is not None else None
-        if old_layout is not None:
-            # Remove old layout and its widgets
-            while old_layout.count():
-                it = old_layout.takeAt(0)
-                w = it.widget()
-                if w is not None:
-                    w.deleteLater()
-            cpu_body_layout.removeItem(old_layout)
-
-        new_grid = QGridLayout()
-        new_grid.setSpacing(6)
-
-        self._core_bars.clear()
-        for i in range(core_count):
-            bar = QProgressBar()
-            bar.setRange(0, 100)
-            bar.setValue(0)
-            bar.setFormat(f"Core {i}  %p%")
-            bar.setAlignment(Qt.AlignCenter)
-            bar.setStyleSheet(
-                """
-                QProgressBar {
-                    border: 1px solid #2b2f3b;
-                    border-radius: 4px;
-                    background: #151821;
-                    color: #DDE1EA;
-                    text-align: center;
-                    padding: 1px;
-                    min-height: 18px;
-                }
-                QProgressBar::chunk {
-                    border-radius: 4px;
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #5f4bff,
-                        stop:1 #ff3cac
-                    );
-                }
-                """
-            )
-            self._core_bars.append(bar)
-            row = i // 2
-            col = i % 2
-            new_grid.addWidget(bar, row, col)
-
-        cpu_body_layout.addLayout(new_grid)
+        # Shrink: park the tail instead of destroying it
+        for bar in reversed(bars[core_count:]):
+            grid.removeWidget(bar)
+            bar.hide()
+            self._spare_bars.append(bar)
+        del bars[core_count:]
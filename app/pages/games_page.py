@@ -1,16 +1,21 @@
 # app/pages/games_page.py
 
+import time
+from functools import cached_property
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QTextEdit, QComboBox, QScrollArea,
+    QLabel, QPushButton, QComboBox, QScrollArea,
     QFileDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool
 
 from pathlib import Path
 
 from app.ui.widgets.card import Card
-from src.qrs.modules.game_optim import GameOptimizer
+from app.ui.widgets.log_view import LogView
+from app.ui.worker import Worker, IterWorker
+from src.qrs.modules.services import get_game_optimizer
 from src.qrs.modules.game_profile import (
     GameProfile,
     load_game_profile,
@@ -19,7 +24,21 @@ from src.qrs.modules.game_profile import (
 )
 
 
-class GamesPage(QWidget):
+# Target game labels, in combo order. Backend process mapping lives in
+# GameOptimizer._game_to_process_names.
+_GAMES = ("Fortnite", "Minecraft", "Valorant", "Call of Duty", "Custom Game…")
+
+# Per-game handlers: combo label -> action -> GamesPage slot name.
+# Games without an entry (or action) log "not implemented".
+_GAME_DISPATCH: dict[str, dict[str, str]] = {
+    "Fortnite": {
+        "clean_crash": "_fn_clean_logs",
+        "clean_shader": "_fn_clean_shader",
+    },
+}
+
+
+class GamesPage(QScrollArea):
     """
     Game Optimizer page
 
@@ -27,27 +46,73 @@ class GamesPage(QWidget):
       - One big title
       - Everything else inside Card widgets
       - Single scroll area with 10px margins and 16px spacing
+
+    The page *is* the scroll area, so there's no wrapper widget/layout
+    between the stack and the scrolled content.
     """
 
+    # (attribute, label, slot) per button, one table per card
+    _SELECTOR_BUTTONS = (
+        # Load from built-in presets folder: profiles/games
+        ("btn_load_profile", "Load Game Profile…", "_load_builtin_profile"),
+        # Save = export current active profile (if any)
+        ("btn_save_profile", "Save Game Profile…", "_export_profile_dialog"),
+    )
+    _FORTNITE_BUTTONS = (
+        ("btn_fn_preset", "Apply Fortnite Gaming Preset", "_fn_preset"),
+        ("btn_fn_disable_record", "Disable Background Recording (Game Bar / DVR)", "_fn_disable_record"),
+        ("btn_fn_clean_logs", "Clean Fortnite Logs & Crash Dumps", "_fn_clean_logs"),
+        ("btn_fn_clean_shader", "Clean Shader / Pipeline Caches", "_fn_clean_shader"),
+        ("btn_fn_clean_dx", "Clean DirectX Cache (Game Scope)", "_clean_dx"),
+    )
+    _TUNING_BUTTONS = (
+        ("btn_cpu_high", "Set Game Process to HIGH Priority", "_set_high_priority"),
+        ("btn_cpu_above", "Set Game Process to ABOVE NORMAL", "_set_above_priority"),
+        ("btn_toggle_nagle", "Disable Nagle (Low-Latency)", "_toggle_nagle"),
+    )
+    _STORAGE_BUTTONS = (
+        ("btn_storage_clean_temp", "Clean Game Temp Files", "_clean_temp"),
+        ("btn_storage_clean_crash", "Clean Game Crash Dumps", "_clean_crash"),
+        ("btn_storage_clean_shader", "Clean Shader / Pipeline Caches", "_clean_shader"),
+        ("btn_storage_clean_dx2", "Clean DirectX Cache (Global)", "_clean_dx"),
+        ("btn_storage_reset_cfg", "Reset Game Config (Backup First)", "_reset_cfg"),
+    )
+    _PROFILE_BUTTONS = (
+        ("btn_profile_apply", "Apply Current Game Profile", "_apply_current_profile"),
+        ("btn_profile_export", "Export Profile to .qrsgame", "_export_profile_dialog"),
+        ("btn_profile_import", "Import Profile from .qrsgame", "_import_profile_dialog"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background: transparent;")
+        self.setObjectName("GamesPage")
 
-        self.opt = GameOptimizer()
         self._current_profile: GameProfile | None = None
 
+        # Built-in profile folder, resolved once; existence is re-checked
+        # only until it has been seen (or created by an export).
+        self._profiles_dir = Path.cwd() / "profiles" / "games"
+        self._profiles_dir_exists = self._profiles_dir.exists()
+
+        # (text, monotonic time) of the last _log line, for de-duplication
+        self._last_log_sig: tuple[str | None, float] = (None, 0.0)
+
+        # Cleanup keys currently running on the pool
+        self._inflight: set[str] = set()
+
+        # key -> (monotonic time, ok, msg) of recent cleanup runs
+        self._recent_ops: dict[str, tuple[float, bool, str]] = {}
+
         # -------------------------------------------------
-        # SCROLL WRAPPER (same pattern as WindowsPage)
+        # SCROLL SETUP
         # -------------------------------------------------
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll.setFrameShape(QScrollArea.NoFrame)
-        scroll.setStyleSheet("background: transparent;")
+        self.setWidgetResizable(True)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setFrameShape(QScrollArea.NoFrame)
 
         container = QWidget()
-        scroll.setWidget(container)
+        container.setObjectName("GamesContainer")
 
         root = QVBoxLayout(container)
         root.setContentsMargins(10, 10, 10, 10)
@@ -57,37 +122,26 @@ class GamesPage(QWidget):
         # PAGE TITLE
         # -------------------------------------------------
         title = QLabel("Game Optimizer")
-        title.setStyleSheet("font-size: 22pt; color: #DDE1EA; font-weight: 700;")
+        title.setObjectName("PageTitle")
         root.addWidget(title)
 
         # -------------------------------------------------
         # TARGET GAME (Card)
         # -------------------------------------------------
-        card_select = Card("Target Game")
-        sel_body = card_select.body()
-
-        row_sel = QHBoxLayout()
+        card_select = Card("Target Game", horizontal=True)
+        row_sel = card_select.body()
         row_sel.setSpacing(12)
 
         self.combo_game = QComboBox()
-        self.combo_game.addItems([
-            "Fortnite",
-            "Minecraft",
-            "Valorant",
-            "Call of Duty",
-            "Custom Game…",
-        ])
+        self.combo_game.addItems(_GAMES)
         self.combo_game.setFixedWidth(220)
-
-        self.btn_load_profile = QPushButton("Load Game Profile…")
-        self.btn_save_profile = QPushButton("Save Game Profile…")
+        # Selected game label, kept in sync via currentTextChanged
+        self._cached_game = self._game_label_from(self.combo_game.currentText())
 
         row_sel.addWidget(self.combo_game)
         row_sel.addStretch()
-        row_sel.addWidget(self.btn_load_profile)
-        row_sel.addWidget(self.btn_save_profile)
+        self._add_buttons(row_sel, self._SELECTOR_BUTTONS)
 
-        sel_body.addLayout(row_sel)
         root.addWidget(card_select)
 
         # -------------------------------------------------
@@ -96,79 +150,72 @@ class GamesPage(QWidget):
         card_log = Card("Game Optimization Log")
         log_body = card_log.body()
 
-        self.log = QTextEdit()
-        self.log.setReadOnly(True)
+        self.log = LogView(max_blocks=500)
         self.log.setMinimumHeight(180)
         log_body.addWidget(self.log)
 
         root.addWidget(card_log)
 
         # -------------------------------------------------
-        # FORTNITE TWEAKS + SYSTEM TUNING (ROW OF CARDS)
+        # ACTION CARDS (Fortnite, tuning, storage, profiles):
+        # built on first show (see showEvent)
         # -------------------------------------------------
-        row_ft = QHBoxLayout()
-        row_ft.setSpacing(12)
-
-        # Fortnite Tweaks
-        card_fn = Card("Fortnite Tweaks")
-        fn_body = card_fn.body()
-
-        self.btn_fn_disable_record = QPushButton(
-            "Disable Background Recording (Game Bar / DVR)"
-        )
-        self.btn_fn_clean_logs = QPushButton("Clean Fortnite Logs & Crash Dumps")
-        self.btn_fn_clean_shader = QPushButton("Clean Shader / Pipeline Caches")
-        self.btn_fn_clean_dx = QPushButton("Clean DirectX Cache (Game Scope)")
+        self._root = root
+        self._lazy_placeholder = QWidget()
+        root.addWidget(self._lazy_placeholder)
 
-        for b in (
-            self.btn_fn_disable_record,
-            self.btn_fn_clean_logs,
-            self.btn_fn_clean_shader,
-            self.btn_fn_clean_dx,
-        ):
-            fn_body.addWidget(b)
+        # Stretch so content hugs the top when short
+        root.addStretch()
 
-        # System Tuning (Per Game)
-        card_tuning = Card("System Tuning (Per Game)")
-        tune_body = card_tuning.body()
+        self.setWidget(container)
 
-        self.btn_cpu_high = QPushButton("Set Game Process to HIGH Priority")
-        self.btn_cpu_above = QPushButton("Set Game Process to ABOVE NORMAL")
-        self.btn_toggle_nagle = QPushButton("Disable Nagle (Low-Latency)")
+        # Wire signals
+        self._connect()
 
-        for b in (self.btn_cpu_high, self.btn_cpu_above, self.btn_toggle_nagle):
-            tune_body.addWidget(b)
+    # -------------------------------------------------
+    # CARD BUILDERS
+    # -------------------------------------------------
+    def _add_buttons(self, body, spec):
+        for attr, label, slot in spec:
+            b = QPushButton(label)
+            setattr(self, attr, b)
+            b.clicked.connect(getattr(self, slot))
+            body.addWidget(b)
+
+    def _button_card(self, title: str, spec) -> Card:
+        card = Card(title)
+        self._add_buttons(card.body(), spec)
+        return card
 
-        row_ft.addWidget(card_fn)
-        row_ft.addWidget(card_tuning)
-        root.addLayout(row_ft)
+    # -------------------------------------------------
+    # DEFERRED CARDS
+    # -------------------------------------------------
+    def showEvent(self, event):
+        # The action cards are only built when the page is first shown,
+        # keeping their widgets out of app startup.
+        if self._lazy_placeholder is not None:
+            self._build_action_cards()
+        super().showEvent(event)
+
+    def _build_action_cards(self):
+        root = self._root
+        idx = root.indexOf(self._lazy_placeholder)
+        root.removeWidget(self._lazy_placeholder)
+        self._lazy_placeholder.deleteLater()
+        self._lazy_placeholder = None
+
+        # Fortnite tweaks + system tuning (row of cards)
+        row_ft = QHBoxLayout()
+        row_ft.setSpacing(12)
+        row_ft.addWidget(self._button_card("Fortnite Tweaks", self._FORTNITE_BUTTONS))
+        row_ft.addWidget(self._button_card("System Tuning (Per Game)", self._TUNING_BUTTONS))
+        root.insertLayout(idx, row_ft)
 
-        # -------------------------------------------------
-        # GAME STORAGE TWEAKS (Card)
-        # -------------------------------------------------
-        card_store = Card("Game Storage Tweaks")
-        st_body = card_store.body()
-
-        self.btn_storage_clean_temp = QPushButton("Clean Game Temp Files")
-        self.btn_storage_clean_crash = QPushButton("Clean Game Crash Dumps")
-        self.btn_storage_clean_shader = QPushButton("Clean Shader / Pipeline Caches")
-        self.btn_storage_clean_dx2 = QPushButton("Clean DirectX Cache (Global)")
-        self.btn_storage_reset_cfg = QPushButton("Reset Game Config (Backup First)")
-
-        for b in (
-            self.btn_storage_clean_temp,
-            self.btn_storage_clean_crash,
-            self.btn_storage_clean_shader,
-            self.btn_storage_clean_dx2,
-            self.btn_storage_reset_cfg,
-        ):
-            st_body.addWidget(b)
-
-        root.addWidget(card_store)
+        # Storage tweaks
+        card_store = self._button_card("Game Storage Tweaks", self._STORAGE_BUTTONS)
+        root.insertWidget(idx + 1, card_store)
 
-        # -------------------------------------------------
-        # GAME PROFILES (Card)
-        # -------------------------------------------------
+        # Game profiles
         card_prof = Card("Game Profiles")
         prof_body = card_prof.body()
 
@@ -177,131 +224,186 @@ class GamesPage(QWidget):
             "network settings, shader cache behavior, and storage cleanup rules."
         )
         desc.setWordWrap(True)
-        desc.setStyleSheet("color:#AAB0BC; font-size:10pt;")
+        desc.setObjectName("CardDesc")
         prof_body.addWidget(desc)
 
-        self.btn_profile_apply = QPushButton("Apply Current Game Profile")
-        self.btn_profile_export = QPushButton("Export Profile to .qrsgame")
-        self.btn_profile_import = QPushButton("Import Profile from .qrsgame")
-
-        for b in (
-            self.btn_profile_apply,
-            self.btn_profile_export,
-            self.btn_profile_import,
-        ):
-            prof_body.addWidget(b)
-
-        root.addWidget(card_prof)
-
-        # Stretch so content hugs the top when short
-        root.addStretch()
+        self._add_buttons(prof_body, self._PROFILE_BUTTONS)
 
-        # Attach scroll to this widget (same as WindowsPage)
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        main_layout.addWidget(scroll)
+        root.insertWidget(idx + 2, card_prof)
 
-        # Wire signals
-        self._connect()
+    # -------------------------------------------------
+    # BACKEND (shared instance, built on first use; pulls in psutil)
+    # -------------------------------------------------
+    @cached_property
+    def opt(self):
+        return get_game_optimizer()
 
     # -------------------------------------------------
     # SIGNAL CONNECTIONS
     # -------------------------------------------------
     def _connect(self):
-        # Game selector profile buttons
+        # Game selector
+        self.combo_game.currentTextChanged.connect(self._on_game_changed)
 
-        # Load from built-in presets folder: profiles/games
-        self.btn_load_profile.clicked.connect(self._load_builtin_profile)
+        # All buttons are wired in _add_buttons from the tables above
 
-        # Save = export current active profile (if any)
-        self.btn_save_profile.clicked.connect(self._export_profile_dialog)
-
-        # Fortnite tweaks (real backend logic)
-        self.btn_fn_disable_record.clicked.connect(self._fn_disable_record)
-        self.btn_fn_clean_logs.clicked.connect(self._fn_clean_logs)
-        self.btn_fn_clean_shader.clicked.connect(self._fn_clean_shader)
-        self.btn_fn_clean_dx.clicked.connect(self._clean_dx)
-
-        # System tuning – now use GameOptimizer backend
-        self.btn_cpu_high.clicked.connect(self._set_high_priority)
-        self.btn_cpu_above.clicked.connect(self._set_above_priority)
-        self.btn_toggle_nagle.clicked.connect(
-            lambda: self._log("[Network] Per-game Nagle toggle not implemented yet (global Nagle is on Windows page).")
-        )
-
-        # Storage tweaks
-        self.btn_storage_clean_temp.clicked.connect(self._clean_temp)
-        self.btn_storage_clean_crash.clicked.connect(self._clean_crash)
-        self.btn_storage_clean_shader.clicked.connect(self._clean_shader)
-        self.btn_storage_clean_dx2.clicked.connect(self._clean_dx)
-        self.btn_storage_reset_cfg.clicked.connect(self._reset_cfg)
+    # -------------------------------------------------
+    # ASYNC HELPER
+    # -------------------------------------------------
+    # Two cards expose the same cleanups; a repeat within this window
+    # reuses the previous result instead of walking the tree again.
+    _RECENT_OP_TTL = 2.0
 
-        # Profiles
-        self.btn_profile_apply.clicked.connect(self._apply_current_profile)
-        self.btn_profile_export.clicked.connect(self._export_profile_dialog)
-        self.btn_profile_import.clicked.connect(self._import_profile_dialog)
+    def _run_async(self, label: str, fn, *args, key: str | None = None):
+        """
+        Run a backend call returning (ok, msg) on the thread pool and log
+        it via _log_result. The clicked button (if any) stays disabled
+        until it finishes so repeated clicks can't stack up.
+
+        With `key`, a second request for the same operation (e.g. from
+        the other card's button) is dropped while the first is running,
+        and one within _RECENT_OP_TTL of the last run logs that result
+        again instead of re-running it.
+        """
+        if key is not None:
+            if key in self._inflight:
+                self._log(f"{label}: already running.")
+                return
+            hit = self._recent_ops.get(key)
+            if hit is not None:
+                age = time.monotonic() - hit[0]
+                if age < self._RECENT_OP_TTL:
+                    _, ok, msg = hit
+                    self._log_result(label, ok, f"{msg} (reused result from {age:.1f}s ago)")
+                    return
+            self._inflight.add(key)
+
+        button = self.sender()
+        if not isinstance(button, QPushButton):
+            button = None
+        if button is not None:
+            button.setEnabled(False)
+
+        def finished(ok, result):
+            if key is not None:
+                self._inflight.discard(key)
+            if button is not None:
+                button.setEnabled(True)
+            if ok:
+                if key is not None:
+                    self._recent_ops[key] = (time.monotonic(), *result)
+                self._log_result(label, *result)
+            else:
+                self._log_result(label, False, repr(result))
+
+        worker = Worker(fn, *args)
+        worker.signals.done.connect(finished)
+        QThreadPool.globalInstance().start(worker)
+
+    def _run_steps(self, label: str, fn, *args):
+        """
+        Run a backend generator yielding (step, ok, msg) on the thread
+        pool, logging each step as it arrives instead of one summary.
+        """
+        button = self.sender()
+        if not isinstance(button, QPushButton):
+            button = None
+        if button is not None:
+            button.setEnabled(False)
+
+        def step(item):
+            name, ok, msg = item
+            self._log_result(f"[{label}/{name}]", ok, msg)
+
+        def finished(ok, result):
+            if button is not None:
+                button.setEnabled(True)
+            if not ok:
+                self._log_result(f"[{label}]", False, repr(result))
+
+        worker = IterWorker(fn, *args)
+        worker.signals.progress.connect(step)
+        worker.signals.done.connect(finished)
+        QThreadPool.globalInstance().start(worker)
 
     # -------------------------------------------------
     # BACKEND LOGIC HOOKS
     # -------------------------------------------------
+    def _fn_preset(self):
+        self._run_steps("Fortnite", self.opt.iter_fortnite_gaming_preset)
+
     def _fn_disable_record(self):
-        ok1, msg1 = self.opt.disable_xbox_game_bar()
-        ok2, msg2 = self.opt.disable_game_dvr()
-        self._log_result(
+        self._run_async(
             "[Fortnite] Disable Game Bar / DVR",
-            ok1 and ok2,
-            msg1 + "\n" + msg2,
+            self.opt.disable_recording_stack,
         )
 
     def _fn_clean_logs(self):
-        ok, msg = self.opt.clean_fortnite_logs_and_crashes()
-        self._log_result("[Fortnite] Clean logs & crash dumps", ok, msg)
+        self._run_async(
+            "[Fortnite] Clean logs & crash dumps",
+            self.opt.clean_fortnite_logs_and_crashes,
+            key="fn_logs",
+        )
 
     def _fn_clean_shader(self):
-        ok, msg = self.opt.clean_fortnite_shader_cache()
-        self._log_result("[Fortnite] Clean shader / pipeline cache", ok, msg)
+        self._run_async(
+            "[Fortnite] Clean shader / pipeline cache",
+            self.opt.clean_fortnite_shader_cache,
+            key="fn_shader",
+        )
 
     def _clean_dx(self):
-        ok, msg = self.opt.clean_directx_cache()
-        self._log_result("[DirectX] Cache cleanup", ok, msg)
+        self._run_async(
+            "[DirectX] Cache cleanup",
+            self.opt.clean_directx_cache,
+            key="clean_dx",
+        )
 
     # ---- System tuning helpers ----
-    def _current_game_label(self) -> str:
-        text = self.combo_game.currentText() or ""
-        return text.strip() or "Custom Game…"
+    @staticmethod
+    def _game_label_from(text: str) -> str:
+        return (text or "").strip() or "Custom Game…"
+
+    def _on_game_changed(self, text: str):
+        self._cached_game = self._game_label_from(text)
 
     def _set_high_priority(self):
-        game = self._current_game_label()
-        ok, msg = self.opt.apply_game_priority(game, "HIGH")
-        self._log_result(f"[CPU] HIGH priority for {game}", ok, msg)
+        game = self._cached_game
+        self._run_async(
+            f"[CPU] HIGH priority for {game}",
+            self.opt.apply_game_priority, game, "HIGH",
+        )
 
     def _set_above_priority(self):
-        game = self._current_game_label()
-        ok, msg = self.opt.apply_game_priority(game, "ABOVE_NORMAL")
-        self._log_result(f"[CPU] ABOVE NORMAL priority for {game}", ok, msg)
+        game = self._cached_game
+        self._run_async(
+            f"[CPU] ABOVE NORMAL priority for {game}",
+            self.opt.apply_game_priority, game, "ABOVE_NORMAL",
+        )
+
+    def _toggle_nagle(self):
+        self._log("[Network] Per-game Nagle toggle not implemented yet (global Nagle is on Windows page).")
 
     # ---- Storage helpers ----
     def _clean_temp(self):
-        game = self._current_game_label()
+        game = self._cached_game
         self._log(f"[Storage] Clean temp files for {game} (not implemented yet)")
 
-    def _clean_crash(self):
-        game = self._current_game_label()
-        if game.lower().startswith("fortnite"):
-            self._fn_clean_logs()
+    def _dispatch(self, action: str, missing: str):
+        slot = _GAME_DISPATCH.get(self._cached_game, {}).get(action)
+        if slot is not None:
+            getattr(self, slot)()
         else:
-            self._log(f"[Storage] Crash cleanup not implemented for {game}")
+            self._log(f"[Storage] {missing} not implemented for {self._cached_game}")
+
+    def _clean_crash(self):
+        self._dispatch("clean_crash", "Crash cleanup")
 
     def _clean_shader(self):
-        game = self._current_game_label()
-        if game.lower().startswith("fortnite"):
-            self._fn_clean_shader()
-        else:
-            self._log(f"[Storage] Shader cleanup not implemented for {game}")
+        self._dispatch("clean_shader", "Shader cleanup")
 
     def _reset_cfg(self):
-        game = self._current_game_label()
+        game = self._cached_game
         self._log(f"[Storage] Reset config for {game} (coming soon, with backup)")
 
     # -------------------------------------------------
@@ -311,14 +413,15 @@ class GamesPage(QWidget):
         """
         Default folder for built-in game profiles.
         """
-        return Path.cwd() / "profiles" / "games"
+        return self._profiles_dir
 
     def _load_builtin_profile(self):
         """
         Open a file dialog rooted at profiles/games and load a .qrsgame.
         """
-        base = self._profiles_folder()
-        start_dir = str(base) if base.exists() else ""
+        if not self._profiles_dir_exists:
+            self._profiles_dir_exists = self._profiles_dir.exists()
+        start_dir = str(self._profiles_dir) if self._profiles_dir_exists else ""
 
         path, _ = QFileDialog.getOpenFileName(
             self,
@@ -349,18 +452,18 @@ class GamesPage(QWidget):
         self._load_profile_from_path(Path(path))
 
     def _load_profile_from_path(self, path: Path):
-        ok, msg, profile = load_game_profile(path)
-        color = "#44dd44" if ok else "#ffcc44"
-
-        # Log result
-        safe_msg = (
-            msg.replace("&", "&amp;")
-               .replace("<", "&lt;")
-               .replace(">", "&gt;")
-        )
-        self.log.append(
-            f"<span style='color:{color}'>{safe_msg}</span>"
-        )
+        # File read + JSON parse on the pool; results applied in _on_profile_loaded
+        worker = Worker(load_game_profile, path)
+        worker.signals.done.connect(self._on_profile_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_profile_loaded(self, ok: bool, result):
+        if not ok:
+            self._log_result("[Profile] Load", False, repr(result))
+            return
+
+        ok, msg, profile = result
+        self.log.append_line(msg, "ok" if ok else "warn")
 
         if profile is None:
             return
@@ -387,9 +490,11 @@ class GamesPage(QWidget):
             self._log("[Profile] No active game profile. Load or import one first.")
             return
 
-        game = self._current_game_label()
-        ok, msg = apply_game_profile(self._current_profile, game, self.opt)
-        self._log_result("[Profile] Apply current profile", ok, msg)
+        game = self._cached_game
+        self._run_async(
+            "[Profile] Apply current profile",
+            apply_game_profile, self._current_profile, game, self.opt,
+        )
 
     def _export_profile_dialog(self):
         """
@@ -401,7 +506,9 @@ class GamesPage(QWidget):
 
         base_name = f"{self._current_profile.name or 'GameProfile'}.qrsgame"
         folder = self._profiles_folder()
-        folder.mkdir(parents=True, exist_ok=True)
+        if not self._profiles_dir_exists:
+            folder.mkdir(parents=True, exist_ok=True)
+            self._profiles_dir_exists = True
 
         path, _ = QFileDialog.getSaveFileName(
             self,
@@ -413,22 +520,25 @@ class GamesPage(QWidget):
             self._log("[Profile] Export cancelled.")
             return
 
-        ok, msg = save_game_profile(path, self._current_profile)
-        self._log_result("[Profile] Export", ok, msg)
+        self._run_async(
+            "[Profile] Export",
+            save_game_profile, path, self._current_profile,
+        )
 
     # -------------------------------------------------
     # LOGGING HELPERS
     # -------------------------------------------------
+    # Identical consecutive lines within this window are dropped, so
+    # spam-clicking a stub button doesn't flood the log.
+    _LOG_DEDUP_SEC = 1.0
+
     def _log(self, text: str):
-        self.log.append(f"<span style='color:#DDE1EA'>{text}</span>")
+        now = time.monotonic()
+        last_text, last_ts = self._last_log_sig
+        if text == last_text and now - last_ts < self._LOG_DEDUP_SEC:
+            return
+        self._last_log_sig = (text, now)
+        self.log.append_line(text, "inf")
 
     def _log_result(self, label: str, ok: bool, msg: str):
-        color = "#44dd44" if ok else "#ff4444"
-        safe = (
-            msg.replace("&", "&amp;")
-               .replace("<", "&lt;")
-               .replace(">", "&gt;")
-        )
-        self.log.append(
-            f"<span style='color:{color}'>{label}: {safe}</span>"
-        )
+        self.log.append_line(f"{label}: {msg}", "ok" if ok else "err")
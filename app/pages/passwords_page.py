@@ -1,14 +1,21 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QPushButton, QLabel, QTextEdit
-from PySide6.QtCore import Qt
+from functools import cached_property
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QScrollArea, QPushButton, QLabel, QLineEdit, QListWidget,
+    QFileDialog
+)
+from PySide6.QtCore import Qt, QThreadPool
+from pathlib import Path
 from app.ui.widgets.card import Card
-from src.qrs.modules.passwords.vault import PasswordVault
+from app.ui.worker import Worker
+from app.ui.styles import TRANSPARENT_CSS, NOTE_CSS
 
 
 class PasswordsPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background: transparent;")
-        self.vault = PasswordVault()
+        self.setStyleSheet(TRANSPARENT_CSS)
+        self._unlocked = False
 
         scroll = QScrollArea(self)
         scroll.setWidgetResizable(True)
@@ -25,22 +32,40 @@ class PasswordsPage(QWidget):
 
         card_vault = Card("Unlock / Create Vault")
         body = card_vault.body()
-        btn_unlock = QPushButton("Unlock / Create Vault")
-        body.addWidget(btn_unlock)
+        self.edit_master = QLineEdit()
+        self.edit_master.setEchoMode(QLineEdit.Password)
+        self.edit_master.setPlaceholderText("Master password")
+        self.btn_unlock = QPushButton("Unlock / Create Vault")
+        self.lbl_status = QLabel("Vault locked.")
+        self.lbl_status.setStyleSheet(NOTE_CSS)
+        body.addWidget(self.edit_master)
+        body.addWidget(self.btn_unlock)
+        body.addWidget(self.lbl_status)
         layout.addWidget(card_vault)
 
         card_add = Card("Add Entry")
         body2 = card_add.body()
-        btn_add = QPushButton("Add Entry")
-        body2.addWidget(btn_add)
+        self.edit_site = QLineEdit()
+        self.edit_site.setPlaceholderText("Site")
+        self.edit_user = QLineEdit()
+        self.edit_user.setPlaceholderText("Username")
+        self.edit_pass = QLineEdit()
+        self.edit_pass.setEchoMode(QLineEdit.Password)
+        self.edit_pass.setPlaceholderText("Password")
+        self.btn_add = QPushButton("Add Entry")
+        self.btn_add.setEnabled(False)
+        for w in (self.edit_site, self.edit_user, self.edit_pass, self.btn_add):
+            body2.addWidget(w)
         layout.addWidget(card_add)
 
         card_entries = Card("Entries")
         body3 = card_entries.body()
-        self.log = QTextEdit()
-        self.log.setReadOnly(True)
-        self.log.setMinimumHeight(200)
-        body3.addWidget(self.log)
+        self.list_entries = QListWidget()
+        self.list_entries.setMinimumHeight(200)
+        body3.addWidget(self.list_entries)
+        self.btn_export = QPushButton("Export to CSV…")
+        self.btn_export.setEnabled(False)
+        body3.addWidget(self.btn_export)
         layout.addWidget(card_entries)
         layout.addStretch()
 
@@ -48,3 +73,106 @@ class PasswordsPage(QWidget):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(scroll)
+
+        self.btn_unlock.clicked.connect(self.unlock_or_create)
+        self.btn_add.clicked.connect(self.add_entry)
+        self.btn_export.clicked.connect(self.export_csv)
+
+    # Vault (and the cryptography import) is only needed once the user
+    # actually unlocks, so build it lazily.
+    @cached_property
+    def vault(self):
+        from src.qrs.modules.passwords.vault import PasswordVault
+        return PasswordVault()
+
+    # -------------------------------------------------
+    # VAULT ACTIONS (KDF + file I/O run on QThreadPool)
+    # -------------------------------------------------
+    def unlock_or_create(self):
+        pwd = self.edit_master.text()
+        if not pwd:
+            self.lbl_status.setText("Enter a master password first.")
+            return
+
+        self.btn_unlock.setEnabled(False)
+        self.lbl_status.setText("Unlocking…")
+
+        worker = Worker(self.vault.load_or_create, pwd)
+        worker.signals.done.connect(self._on_unlocked)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_unlocked(self, ok: bool, result):
+        self.btn_unlock.setEnabled(True)
+        if not ok:
+            self._unlocked = False
+            self.btn_add.setEnabled(False)
+            self.btn_export.setEnabled(False)
+            self.lbl_status.setText(f"Unlock failed: {result!r}")
+            return
+
+        self._unlocked = True
+        self.lbl_status.setText("Vault unlocked.")
+        self.edit_master.clear()
+        self.btn_add.setEnabled(True)
+        self.btn_export.setEnabled(True)
+        self.refresh_list()
+
+    def add_entry(self):
+        site = self.edit_site.text().strip()
+        if not self._unlocked or not site:
+            return
+
+        self.btn_add.setEnabled(False)
+
+        worker = Worker(
+            self.vault.add_entry,
+            site,
+            self.edit_user.text(),
+            self.edit_pass.text(),
+        )
+        worker.signals.done.connect(self._on_entry_added)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_entry_added(self, ok: bool, result):
+        self.btn_add.setEnabled(True)
+        if not ok:
+            self.lbl_status.setText(f"Save failed: {result!r}")
+            return
+
+        self.edit_site.clear()
+        self.edit_user.clear()
+        self.edit_pass.clear()
+        self.refresh_list()
+
+    def export_csv(self):
+        if not self._unlocked:
+            return
+
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Vault (plaintext!)",
+            "vault.csv",
+            "CSV Files (*.csv);;All Files (*.*)",
+        )
+        if not path:
+            return
+
+        try:
+            n = self.vault.export_csv(Path(path))
+        except Exception as e:
+            self.lbl_status.setText(f"Export failed: {e!r}")
+            return
+        self.lbl_status.setText(f"Exported {n} entries to {path}")
+
+    def refresh_list(self):
+        labels = [
+            f"{site}  —  {entry.get('user', '')}"
+            for site, entry in self.vault.list_entries()
+        ]
+        # One repaint for the whole batch instead of one per row
+        self.list_entries.setUpdatesEnabled(False)
+        self.list_entries.blockSignals(True)
+        self.list_entries.clear()
+        self.list_entries.addItems(labels)
+        self.list_entries.blockSignals(False)
+        self.list_entries.setUpdatesEnabled(True)
@@ -12,12 +12,21 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTextEdit,
     QScrollArea,
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QThreadPool
 
 from app.ui.widgets.card import Card
+from app.ui.widgets.log_view import LogView
+from app.ui.worker import Worker
+from app.ui.styles import (
+    TRANSPARENT_CSS,
+    PAGE_TITLE_CSS,
+    HINT_CSS,
+    STATUS_PENDING_CSS,
+    STATUS_OK_CSS,
+    STATUS_ERR_CSS,
+)
 from src.qrs.service.controller import (
     start_daemon,
     stop_daemon,
@@ -39,7 +48,7 @@ class ServicePage(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(TRANSPARENT_CSS)
 
         # ----------------------------------------
         # Scroll wrapper (same pattern as other pages)
@@ -49,7 +58,7 @@ class ServicePage(QWidget):
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll.setFrameShape(QScrollArea.NoFrame)
-        scroll.setStyleSheet("background: transparent;")
+        scroll.setStyleSheet(TRANSPARENT_CSS)
 
         container = QWidget()
         scroll.setWidget(container)
@@ -62,7 +71,7 @@ class ServicePage(QWidget):
         # Header
         # ----------------------------------------
         title = QLabel("Service / Daemon Control")
-        title.setStyleSheet("font-size: 22pt; color: #DDE1EA; font-weight: 700;")
+        title.setStyleSheet(PAGE_TITLE_CSS)
         root.addWidget(title)
 
         subtitle = QLabel(
@@ -70,7 +79,7 @@ class ServicePage(QWidget):
             "This process handles game detection, telemetry, and automation."
         )
         subtitle.setWordWrap(True)
-        subtitle.setStyleSheet("color:#AAB0BC; font-size:10pt;")
+        subtitle.setStyleSheet(HINT_CSS)
         root.addWidget(subtitle)
 
         # ----------------------------------------
@@ -83,7 +92,7 @@ class ServicePage(QWidget):
         row.setSpacing(12)
 
         self.lbl_status = QLabel("Daemon: Unknown")
-        self.lbl_status.setStyleSheet("color:#FFA500; font-weight:600;")
+        self.lbl_status.setStyleSheet(STATUS_PENDING_CSS)
 
         self.btn_start = QPushButton("Start Daemon")
         self.btn_stop = QPushButton("Stop Daemon")
@@ -123,8 +132,7 @@ class ServicePage(QWidget):
         log_card = Card("Service Log")
         lv = log_card.body()
 
-        self.log = QTextEdit()
-        self.log.setReadOnly(True)
+        self.log = LogView(max_blocks=500)
         self.log.setMinimumHeight(220)
         lv.addWidget(self.log)
 
@@ -141,8 +149,11 @@ class ServicePage(QWidget):
         # Wire signals
         self._connect()
 
-        # Start periodic status polling
+        # Start periodic status polling (the check itself runs on the pool)
+        self._status_pending = False
+        self._status_running: bool | None = None
         self._status_timer = QTimer(self)
+        self._status_timer.setTimerType(Qt.CoarseTimer)
         self._status_timer.timeout.connect(self._refresh_status)
         self._status_timer.start(1000)
 
@@ -166,19 +177,34 @@ class ServicePage(QWidget):
     # Status handling
     # ---------------------------------------------------
     def _refresh_status(self):
-        running = False
-        try:
-            running = daemon_running()
-        except Exception as e:
-            self._log(f"[Status] Error checking daemon: {e!r}")
+        # daemon_running() probes the PID file / process table; keep it off
+        # the UI thread and never stack a second check behind a slow one.
+        if self._status_pending:
+            return
+        self._status_pending = True
+
+        worker = Worker(daemon_running)
+        worker.signals.done.connect(self._on_status)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_status(self, ok: bool, result):
+        self._status_pending = False
+        if ok:
+            running = bool(result)
+        else:
+            self._log(f"[Status] Error checking daemon: {result!r}")
             running = False
 
+        if running == self._status_running:
+            return
+        self._status_running = running
+
         if running:
             self.lbl_status.setText("Daemon: RUNNING")
-            self.lbl_status.setStyleSheet("color:#44DD44; font-weight:600;")
+            self.lbl_status.setStyleSheet(STATUS_OK_CSS)
         else:
             self.lbl_status.setText("Daemon: STOPPED")
-            self.lbl_status.setStyleSheet("color:#FF5555; font-weight:600;")
+            self.lbl_status.setStyleSheet(STATUS_ERR_CSS)
 
     # ---------------------------------------------------
     # Button handlers
@@ -232,18 +258,10 @@ class ServicePage(QWidget):
     # Helpers
     # ---------------------------------------------------
     def _log(self, text: str):
-        self.log.append(f"<span style='color:#DDE1EA'>{text}</span>")
+        self.log.append_line(text, "inf")
 
     def _log_result(self, label: str, ok: bool, msg: str):
-        color = "#44DD44" if ok else "#FF5555"
-        safe = (
-            msg.replace("&", "&amp;")
-               .replace("<", "&lt;")
-               .replace(">", "&gt;")
-        )
-        self.log.append(
-            f"<span style='color:{color}'>[{label}] {safe}</span>"
-        )
+        self.log.append_line(f"[{label}] {msg}", "ok" if ok else "err")
 
     def _ensure_dir(self, p: Path):
         try:
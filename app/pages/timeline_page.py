@@ -4,25 +4,32 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QScrollArea
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPlainTextEdit, QScrollArea
 from PySide6.QtCore import Qt, QTimer
 
+from app.ui.styles import TRANSPARENT_CSS, PAGE_TITLE_CSS
+
 
 class TimelinePage(QWidget):
+    # Lines kept in the view; older events are dropped.
+    _MAX_LINES = 500
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(TRANSPARENT_CSS)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
 
         self.title = QLabel("System Timeline")
-        self.title.setStyleSheet("font-size:22pt; color:#DDE1EA; font-weight:700;")
+        self.title.setStyleSheet(PAGE_TITLE_CSS)
         layout.addWidget(self.title)
 
-        self.view = QTextEdit()
+        self.view = QPlainTextEdit()
         self.view.setReadOnly(True)
+        self.view.setUndoRedoEnabled(False)
+        self.view.setMaximumBlockCount(self._MAX_LINES)  # drop oldest lines
         self.view.setMinimumHeight(420)
         layout.addWidget(self.view)
 
@@ -30,6 +37,7 @@ class TimelinePage(QWidget):
 
         # Poll for updates
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.CoarseTimer)
         self.timer.setInterval(1000)
         self.timer.timeout.connect(self._update_timeline)
         self.timer.start()
@@ -61,7 +69,8 @@ class TimelinePage(QWidget):
 
             out.append(f"[{name}]  {info}")
 
-        self.view.setPlainText("\n".join(out))
+        # Only the tail fits under the block cap; don't lay out the rest.
+        self.view.setPlainText("\n".join(out[-self._MAX_LINES:]))
         self.view.verticalScrollBar().setValue(
             self.view.verticalScrollBar().maximum()
         )
@@ -1,25 +1,99 @@
 # app/pages/windows_page.py
+from functools import cached_property, partial
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTextEdit, QLabel, QScrollArea, QFileDialog
+    QLabel, QScrollArea, QFileDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool
 
 from app.ui.widgets.card import Card
 from app.ui.widgets.toggle import Toggle
 from app.ui.widgets.glow_indicator import GlowIndicator
 from app.ui.widgets.divider import Divider
-
-from src.qrs.modules.windows_optim import WindowsOptimizer
+from app.ui.widgets.log_view import LogView
+from app.ui.worker import Worker
+from app.ui.styles import TRANSPARENT_CSS, PAGE_TITLE_CSS
+from src.qrs.modules.services import get_windows_optimizer
 
 
 class WindowsPage(QWidget):
+    # (button attribute, handler name, bound args) for every button;
+    # handlers with bound args also receive the button first
+    _WIRING = (
+        # scan
+        ("btn_scan", "_scan", ()),
+
+        # cleanup
+        ("btn_clean", "_clean", ()),
+        ("btn_deep_clean", "_deep_clean", ()),
+
+        # safety
+        ("btn_restore", "_restore", ()),
+
+        # power
+        ("btn_plan", "_plan", ()),
+
+        # mem leak
+        ("btn_ml_start", "_ml_start", ()),
+        ("btn_ml_stop", "_ml_stop", ()),
+
+        # network
+        ("btn_dns_cf", "_dns", ("1.1.1.1", "1.0.0.1")),
+        ("btn_dns_gg", "_dns", ("8.8.8.8", "8.8.4.4")),
+        ("btn_ctcp_on", "_ctcp", (True,)),
+        ("btn_ctcp_off", "_ctcp", (False,)),
+        ("btn_auto_norm", "_autotune", ("normal",)),
+        ("btn_auto_restr", "_autotune", ("restricted",)),
+        ("btn_nagle_off", "_nagle_off", ()),
+        ("btn_ping", "_ping", ()),
+
+        # startup
+        ("btn_list_startup", "_startup_list", ()),
+
+        # storage
+        ("btn_analyze_drive", "_analyze_drive", ()),
+        ("btn_top25", "_top25", ()),
+        ("btn_top_dirs", "_top_dirs", ()),
+        ("btn_clear_cache", "_clear_cache", ()),
+
+        # profiles
+        ("btn_prof_game", "_apply_profile", ("gaming",)),
+        ("btn_prof_prod", "_apply_profile", ("productivity",)),
+        ("btn_prof_stream", "_apply_profile", ("streaming",)),
+        ("btn_prof_save", "_save_profile", ()),
+        ("btn_prof_load", "_load_profile", ()),
+
+        # repairops
+        ("btn_repair_wu", "_repair_wu", ()),
+        ("btn_reset_net", "_reset_net", ()),
+        ("btn_dism_sfc", "_run_dism_sfc", ()),
+        ("btn_reset_store", "_reset_store_cache", ()),
+
+        # debloat
+        ("btn_debloat_xbox", "_debloat_xbox", ()),
+        ("btn_debloat_bg", "_debloat_bg_apps", ()),
+        ("btn_debloat_telemetry", "_debloat_telemetry", ()),
+        ("btn_debloat_cortana", "_debloat_cortana", ()),
+        ("btn_debloat_revert", "_debloat_revert", ()),
+
+        # ui tweaks
+        ("btn_ui_disable_bing", "_ui_disable_bing", ()),
+        ("btn_ui_disable_widgets", "_ui_disable_widgets", ()),
+        ("btn_ui_disable_chat", "_ui_disable_chat", ()),
+        ("btn_ui_explorer_thispc", "_ui_explorer_thispc", ()),
+        ("btn_ui_show_ext", "_ui_show_ext", ()),
+        ("btn_ui_restore_ui", "_ui_restore_ui", ()),
+
+        # backup
+        ("btn_backup_create", "_backup_create", ()),
+        ("btn_backup_restore", "_backup_restore", ()),
+        ("btn_backup_open", "_backup_open", ()),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background: transparent;")
-
-        # backend
-        self.opt = WindowsOptimizer()
+        self.setStyleSheet(TRANSPARENT_CSS)
 
         # SCROLL WRAPPER
         scroll = QScrollArea()
@@ -27,7 +101,7 @@ class WindowsPage(QWidget):
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll.setFrameShape(QScrollArea.NoFrame)
-        scroll.setStyleSheet("background: transparent;")
+        scroll.setStyleSheet(TRANSPARENT_CSS)
 
         container = QWidget()
         scroll.setWidget(container)
@@ -38,7 +112,7 @@ class WindowsPage(QWidget):
 
         # TITLE
         title = QLabel("Windows Optimizer")
-        title.setStyleSheet("font-size: 22pt; color: #DDE1EA; font-weight:700;")
+        title.setStyleSheet(PAGE_TITLE_CSS)
         root.addWidget(title)
 
         # SYSTEM SCAN
@@ -55,8 +129,7 @@ class WindowsPage(QWidget):
         head.addWidget(self.spinner)
         v.addLayout(head)
 
-        self.log = QTextEdit()
-        self.log.setReadOnly(True)
+        self.log = LogView(max_blocks=500)
         self.log.setMinimumHeight(200)
         v.addWidget(self.log)
 
@@ -75,18 +148,15 @@ class WindowsPage(QWidget):
         pv.addWidget(self.btn_plan)
 
         # CLEANUP
-        cleanup = Card("Cleanup")
-        cl = cleanup.body()
-        self.btn_clean = QPushButton("Clean Temp Files")
-        self.btn_deep_clean = QPushButton("Deep Cleanup (System/Junk)")
-        cl.addWidget(self.btn_clean)
-        cl.addWidget(self.btn_deep_clean)
+        cleanup = self._button_card("Cleanup", (
+            ("btn_clean", "Clean Temp Files"),
+            ("btn_deep_clean", "Deep Cleanup (System/Junk)"),
+        ))
 
         # SAFETY
-        safety = Card("Safety")
-        st = safety.body()
-        self.btn_restore = QPushButton("Create Restore Point")
-        st.addWidget(self.btn_restore)
+        safety = self._button_card("Safety", (
+            ("btn_restore", "Create Restore Point"),
+        ))
 
         row1.addWidget(power)
         row1.addWidget(cleanup)
@@ -98,39 +168,27 @@ class WindowsPage(QWidget):
         row2.setSpacing(12)
 
         # MEMORY LEAK
-        leak = Card("Memory-Leak Protector")
-        lv = leak.body()
-        self.btn_ml_start = QPushButton("Start (Fortnite, 1024 MB)")
-        self.btn_ml_stop = QPushButton("Stop")
-        lv.addWidget(self.btn_ml_start)
-        lv.addWidget(self.btn_ml_stop)
+        leak = self._button_card("Memory-Leak Protector", (
+            ("btn_ml_start", "Start (Fortnite, 1024 MB)"),
+            ("btn_ml_stop", "Stop"),
+        ))
 
         # NETWORK
-        net = Card("Network Optimizer")
-        nv = net.body()
-
-        self.btn_dns_cf = QPushButton("Set DNS: 1.1.1.1 / 1.0.0.1")
-        self.btn_dns_gg = QPushButton("Set DNS: 8.8.8.8 / 8.8.4.4")
-        self.btn_ctcp_on = QPushButton("Enable CTCP")
-        self.btn_ctcp_off = QPushButton("Disable CTCP")
-        self.btn_auto_norm = QPushButton("TCP Autotuning: normal")
-        self.btn_auto_restr = QPushButton("TCP Autotuning: restricted")
-        self.btn_nagle_off = QPushButton("Disable Nagle (gaming)")
-        self.btn_ping = QPushButton("Latency test (1.1.1.1)")
-
-        for w in (
-            self.btn_dns_cf, self.btn_dns_gg,
-            self.btn_ctcp_on, self.btn_ctcp_off,
-            self.btn_auto_norm, self.btn_auto_restr,
-            self.btn_nagle_off, self.btn_ping
-        ):
-            nv.addWidget(w)
+        net = self._button_card("Network Optimizer", (
+            ("btn_dns_cf", "Set DNS: 1.1.1.1 / 1.0.0.1"),
+            ("btn_dns_gg", "Set DNS: 8.8.8.8 / 8.8.4.4"),
+            ("btn_ctcp_on", "Enable CTCP"),
+            ("btn_ctcp_off", "Disable CTCP"),
+            ("btn_auto_norm", "TCP Autotuning: normal"),
+            ("btn_auto_restr", "TCP Autotuning: restricted"),
+            ("btn_nagle_off", "Disable Nagle (gaming)"),
+            ("btn_ping", "Latency test (1.1.1.1)"),
+        ))
 
         # STARTUP
-        startup = Card("Startup Optimizer")
-        sv2 = startup.body()
-        self.btn_list_startup = QPushButton("List Startup Entries")
-        sv2.addWidget(self.btn_list_startup)
+        startup = self._button_card("Startup Optimizer", (
+            ("btn_list_startup", "List Startup Entries"),
+        ))
 
         row2.addWidget(leak)
         row2.addWidget(net)
@@ -138,126 +196,55 @@ class WindowsPage(QWidget):
         root.addLayout(row2)
 
         # STORAGE ANALYZER ------------------------
-        storage = Card("Storage Analyzer")
-        st = storage.body()
-
-        self.btn_analyze_drive = QPushButton("Analyze Disk Usage")
-        self.btn_top25 = QPushButton("Analyze Largest 25 Files")
-        self.btn_top_dirs = QPushButton("Analyze Largest Directories")
-        self.btn_clear_cache = QPushButton("Clear Browser + Store Cache")
-
-        st.addWidget(self.btn_analyze_drive)
-        st.addWidget(self.btn_top25)
-        st.addWidget(self.btn_top_dirs)
-        st.addWidget(self.btn_clear_cache)
-
-        root.addWidget(storage)
+        root.addWidget(self._button_card("Storage Analyzer", (
+            ("btn_analyze_drive", "Analyze Disk Usage"),
+            ("btn_top25", "Analyze Largest 25 Files"),
+            ("btn_top_dirs", "Analyze Largest Directories"),
+            ("btn_clear_cache", "Clear Browser + Store Cache"),
+        )))
 
         # PROFILE MANAGER -------------------------
-        prof = Card("Profile Manager")
-        pf = prof.body()
-
-        self.btn_prof_game = QPushButton("Apply Gaming Profile")
-        self.btn_prof_prod = QPushButton("Apply Productivity Profile")
-        self.btn_prof_stream = QPushButton("Apply Streaming Profile")
-        self.btn_prof_save = QPushButton("Save Current As Profile…")
-        self.btn_prof_load = QPushButton("Load Custom Profile…")
-
-        for w in (
-            self.btn_prof_game,
-            self.btn_prof_prod,
-            self.btn_prof_stream,
-            self.btn_prof_save,
-            self.btn_prof_load,
-        ):
-            w.setMinimumHeight(34)
-            pf.addWidget(w)
-
-        root.addWidget(prof)
+        root.addWidget(self._button_card("Profile Manager", (
+            ("btn_prof_game", "Apply Gaming Profile"),
+            ("btn_prof_prod", "Apply Productivity Profile"),
+            ("btn_prof_stream", "Apply Streaming Profile"),
+            ("btn_prof_save", "Save Current As Profile…"),
+            ("btn_prof_load", "Load Custom Profile…"),
+        ), min_height=34))
 
         # ADVANCED TOOLS --------------------------
-        repair_card = Card("System RepairOps")
-        rv = repair_card.body()
-
-        self.btn_repair_wu = QPushButton("Repair Windows Update")
-        self.btn_reset_net = QPushButton("Reset Network Stack")
-        self.btn_dism_sfc = QPushButton("Run DISM + SFC Repair")
-        self.btn_reset_store = QPushButton("Reset Microsoft Store Cache")
-
-        for b in (
-            self.btn_repair_wu,
-            self.btn_reset_net,
-            self.btn_dism_sfc,
-            self.btn_reset_store,
-        ):
-            b.setMinimumHeight(34)
-            rv.addWidget(b)
-
-        root.addWidget(repair_card)
+        root.addWidget(self._button_card("System RepairOps", (
+            ("btn_repair_wu", "Repair Windows Update"),
+            ("btn_reset_net", "Reset Network Stack"),
+            ("btn_dism_sfc", "Run DISM + SFC Repair"),
+            ("btn_reset_store", "Reset Microsoft Store Cache"),
+        ), min_height=34))
 
         # DEBLOAT
-        debloat_card = Card("Safe Debloat")
-        dv = debloat_card.body()
-
-        self.btn_debloat_xbox = QPushButton("Disable Xbox Game Bar / DVR")
-        self.btn_debloat_bg = QPushButton("Disable Background Apps")
-        self.btn_debloat_telemetry = QPushButton("Disable Telemetry Tasks (safe)")
-        self.btn_debloat_cortana = QPushButton("Limit Cortana / Search Indexing")
-        self.btn_debloat_revert = QPushButton("Revert Safe Debloat Profile")
-
-        for b in (
-            self.btn_debloat_xbox,
-            self.btn_debloat_bg,
-            self.btn_debloat_telemetry,
-            self.btn_debloat_cortana,
-            self.btn_debloat_revert,
-        ):
-            b.setMinimumHeight(34)
-            dv.addWidget(b)
-
-        root.addWidget(debloat_card)
+        root.addWidget(self._button_card("Safe Debloat", (
+            ("btn_debloat_xbox", "Disable Xbox Game Bar / DVR"),
+            ("btn_debloat_bg", "Disable Background Apps"),
+            ("btn_debloat_telemetry", "Disable Telemetry Tasks (safe)"),
+            ("btn_debloat_cortana", "Limit Cortana / Search Indexing"),
+            ("btn_debloat_revert", "Revert Safe Debloat Profile"),
+        ), min_height=34))
 
         # UI TWEAKS
-        ui_card = Card("Taskbar & Explorer Tweaks")
-        uv = ui_card.body()
-
-        self.btn_ui_disable_bing = QPushButton("Disable Bing / Web in Start Search")
-        self.btn_ui_disable_widgets = QPushButton("Hide Widgets")
-        self.btn_ui_disable_chat = QPushButton("Hide Chat Icon")
-        self.btn_ui_explorer_thispc = QPushButton("Open Explorer in 'This PC'")
-        self.btn_ui_show_ext = QPushButton("Show File Extensions")
-        self.btn_ui_restore_ui = QPushButton("Restore UI Defaults")
-
-        for b in (
-            self.btn_ui_disable_bing,
-            self.btn_ui_disable_widgets,
-            self.btn_ui_disable_chat,
-            self.btn_ui_explorer_thispc,
-            self.btn_ui_show_ext,
-            self.btn_ui_restore_ui,
-        ):
-            b.setMinimumHeight(34)
-            uv.addWidget(b)
-
-        root.addWidget(ui_card)
+        root.addWidget(self._button_card("Taskbar & Explorer Tweaks", (
+            ("btn_ui_disable_bing", "Disable Bing / Web in Start Search"),
+            ("btn_ui_disable_widgets", "Hide Widgets"),
+            ("btn_ui_disable_chat", "Hide Chat Icon"),
+            ("btn_ui_explorer_thispc", "Open Explorer in 'This PC'"),
+            ("btn_ui_show_ext", "Show File Extensions"),
+            ("btn_ui_restore_ui", "Restore UI Defaults"),
+        ), min_height=34))
 
         # BACKUP
-        backup_card = Card("Backup & Restore")
-        bv = backup_card.body()
-
-        self.btn_backup_create = QPushButton("Create Backup Snapshot")
-        self.btn_backup_restore = QPushButton("Restore Latest Backup")
-        self.btn_backup_open = QPushButton("Open Backup Folder")
-
-        for b in (
-            self.btn_backup_create,
-            self.btn_backup_restore,
-            self.btn_backup_open,
-        ):
-            b.setMinimumHeight(34)
-            bv.addWidget(b)
-
-        root.addWidget(backup_card)
+        root.addWidget(self._button_card("Backup & Restore", (
+            ("btn_backup_create", "Create Backup Snapshot"),
+            ("btn_backup_restore", "Restore Latest Backup"),
+            ("btn_backup_open", "Open Backup Folder"),
+        ), min_height=34))
 
         root.addStretch()
 
@@ -267,188 +254,216 @@ class WindowsPage(QWidget):
 
         self._connect()
 
+    # CARD BUILDER -------------------------------
+    def _button_card(self, title: str, spec, min_height: int = 0) -> Card:
+        """Card with one QPushButton per (attribute, label), stored on self."""
+        card = Card(title)
+        body = card.body()
+        for attr, label in spec:
+            b = QPushButton(label)
+            if min_height:
+                b.setMinimumHeight(min_height)
+            setattr(self, attr, b)
+            body.addWidget(b)
+        return card
+
+    # BACKEND ------------------------------------
+    # Shared instance, built on first use (keeps the import off startup)
+    @cached_property
+    def opt(self):
+        return get_windows_optimizer()
+
     # SIGNALS ------------------------------------
     def _connect(self):
-        # scan
-        self.btn_scan.clicked.connect(self._scan)
-
-        # cleanup
-        self.btn_clean.clicked.connect(self._clean)
-        self.btn_deep_clean.clicked.connect(self._deep_clean)
-
-        # safety
-        self.btn_restore.clicked.connect(self._restore)
-
-        # power
-        self.btn_plan.clicked.connect(self._plan)
-
-        # mem leak
-        self.btn_ml_start.clicked.connect(self._ml_start)
-        self.btn_ml_stop.clicked.connect(self._ml_stop)
-
-        # network
-        self.btn_dns_cf.clicked.connect(lambda: self._dns("1.1.1.1", "1.0.0.1"))
-        self.btn_dns_gg.clicked.connect(lambda: self._dns("8.8.8.8", "8.8.4.4"))
-        self.btn_ctcp_on.clicked.connect(lambda: self._ctcp(True))
-        self.btn_ctcp_off.clicked.connect(lambda: self._ctcp(False))
-        self.btn_auto_norm.clicked.connect(lambda: self._autotune("normal"))
-        self.btn_auto_restr.clicked.connect(lambda: self._autotune("restricted"))
-        self.btn_nagle_off.clicked.connect(self._nagle_off)
-        self.btn_ping.clicked.connect(self._ping)
-
-        # startup
-        self.btn_list_startup.clicked.connect(self._startup_list)
-
-        # storage
-        self.btn_analyze_drive.clicked.connect(self._analyze_drive)
-        self.btn_top25.clicked.connect(self._top25)
-        self.btn_top_dirs.clicked.connect(self._top_dirs)
-        self.btn_clear_cache.clicked.connect(self._clear_cache)
-
-        # profiles
-        self.btn_prof_game.clicked.connect(lambda: self._apply_profile("gaming"))
-        self.btn_prof_prod.clicked.connect(lambda: self._apply_profile("productivity"))
-        self.btn_prof_stream.clicked.connect(lambda: self._apply_profile("streaming"))
-        self.btn_prof_save.clicked.connect(self._save_profile)
-        self.btn_prof_load.clicked.connect(self._load_profile)
-
-        # repairops
-        self.btn_repair_wu.clicked.connect(self._repair_wu)
-        self.btn_reset_net.clicked.connect(self._reset_net)
-        self.btn_dism_sfc.clicked.connect(self._run_dism_sfc)
-        self.btn_reset_store.clicked.connect(self._reset_store_cache)
-
-        # debloat
-        self.btn_debloat_xbox.clicked.connect(self._debloat_xbox)
-        self.btn_debloat_bg.clicked.connect(self._debloat_bg_apps)
-        self.btn_debloat_telemetry.clicked.connect(self._debloat_telemetry)
-        self.btn_debloat_cortana.clicked.connect(self._debloat_cortana)
-        self.btn_debloat_revert.clicked.connect(self._debloat_revert)
-
-        # ui tweaks
-        self.btn_ui_disable_bing.clicked.connect(self._ui_disable_bing)
-        self.btn_ui_disable_widgets.clicked.connect(self._ui_disable_widgets)
-        self.btn_ui_disable_chat.clicked.connect(self._ui_disable_chat)
-        self.btn_ui_explorer_thispc.clicked.connect(self._ui_explorer_thispc)
-        self.btn_ui_show_ext.clicked.connect(self._ui_show_ext)
-        self.btn_ui_restore_ui.clicked.connect(self._ui_restore_ui)
-
-        # backup
-        self.btn_backup_create.clicked.connect(self._backup_create)
-        self.btn_backup_restore.clicked.connect(self._backup_restore)
-        self.btn_backup_open.clicked.connect(self._backup_open)
+        for attr, handler, args in self._WIRING:
+            button = getattr(self, attr)
+            slot = getattr(self, handler)
+            if args:
+                # partial() slots get no sender(); pass the button instead
+                slot = partial(slot, button, *args)
+            button.clicked.connect(slot)
+
+    # LOG -----------------------------------------
+    def _log(self, text: str):
+        # Backend output is plain text; LogView batches the inserts
+        self.log.append_text(text)
+
+    # ASYNC ---------------------------------------
+    def _run_async(self, button, fn, on_done, *args):
+        """
+        Run a slow backend call on the thread pool. `button` (if given) is
+        disabled until it finishes; `on_done(result)` runs back on the GUI
+        thread.
+        """
+        if button is not None:
+            button.setEnabled(False)
+
+        def finished(ok, result):
+            if button is not None:
+                button.setEnabled(True)
+            if ok:
+                on_done(result)
+            else:
+                self._log(f"[Error] {result!r}")
+
+        worker = Worker(fn, *args)
+        worker.signals.done.connect(finished)
+        QThreadPool.globalInstance().start(worker)
+
+    def _run_logged(self, prefix: str, fn, *args, button=None):
+        """
+        Async call of a backend method returning (ok, msg); msg is logged,
+        optionally behind `prefix`. `button` (default: the clicked button,
+        if any) is held disabled meanwhile.
+        """
+        if button is None:
+            button = self.sender()
+        if not isinstance(button, QPushButton):
+            button = None
+        self._run_async(button, fn, partial(self._log_msg, prefix), *args)
+
+    def _log_msg(self, prefix: str, result):
+        ok, msg = result
+        self._log(f"{prefix} {msg}" if prefix else msg)
 
     # LOGIC --------------------------------------
+    # Every backend call runs on the pool; handlers only start it and log
+    # the result, so registry/shell work never blocks the UI thread.
 
     def _scan(self):
+        # Not via _run_async: the spinner belongs to the scan alone and
+        # must also come down when the scan fails.
         self.spinner.show()
         self.log.clear()
-        self.log.append(self.opt.quick_scan())
+        self.btn_scan.setEnabled(False)
+        worker = Worker(self.opt.quick_scan)
+        worker.signals.done.connect(self._on_scanned)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_scanned(self, ok: bool, result):
+        self.btn_scan.setEnabled(True)
         self.spinner.hide()
+        self._log(result if ok else f"[Error] {result!r}")
 
     def _clean(self):
-        n = self.opt.cleanup_temp_files()
-        self.log.append(f"[Cleanup] Removed ~{n} files.")
+        self._run_async(
+            self.btn_clean,
+            self.opt.cleanup_temp_files,
+            self._on_cleaned,
+        )
+
+    def _on_cleaned(self, n):
+        self._log(f"[Cleanup] Removed ~{n} files.")
 
     def _deep_clean(self):
-        n = self.opt.deep_cleanup()
-        self.log.append(f"[Deep Cleanup] Removed {n} items.")
+        self._run_async(
+            self.btn_deep_clean,
+            self.opt.deep_cleanup,
+            self._on_deep_cleaned,
+        )
+
+    def _on_deep_cleaned(self, n):
+        self._log(f"[Deep Cleanup] Removed {n} items.")
 
     def _restore(self):
-        ok, msg = self.opt.create_restore_point("QrsTweaks Restore")
-        self.log.append(f"[Restore] {msg}")
+        self._run_logged("[Restore]", self.opt.create_restore_point, "QrsTweaks Restore")
 
     def _plan(self):
-        ok, msg = self.opt.create_high_perf_powerplan()
-        self.log.append(f"[Power] {msg}")
+        self._run_logged("[Power]", self.opt.create_high_perf_powerplan)
 
     def _ml_start(self):
-        ok, msg = self.opt.start_memleak_protector(
-            process_names=["FortniteClient-Win64-Shipping.exe"], mb_threshold=1024
+        self._run_logged(
+            "[MemLeak]", self.opt.start_memleak_protector,
+            ["FortniteClient-Win64-Shipping.exe"], 1024,
         )
-        self.log.append(f"[MemLeak] {msg}")
 
     def _ml_stop(self):
-        ok, msg = self.opt.stop_memleak_protector()
-        self.log.append(f"[MemLeak] {msg}")
+        self._run_logged("[MemLeak]", self.opt.stop_memleak_protector)
 
-    def _dns(self, p, s):
-        ok, msg = self.opt.set_dns(p, s)
-        self.log.append(f"[DNS] {msg}")
+    def _dns(self, button, p, s):
+        self._run_logged("[DNS]", self.opt.set_dns, p, s, button=button)
 
-    def _ctcp(self, enable):
-        ok, msg = self.opt.enable_ctcp(enable)
-        self.log.append(f"[CTCP] {msg}")
+    def _ctcp(self, button, enable):
+        self._run_logged("[CTCP]", self.opt.enable_ctcp, enable, button=button)
 
-    def _autotune(self, level):
-        ok, msg = self.opt.autotuning(level)
-        self.log.append(f"[TCP] {msg}")
+    def _autotune(self, button, level):
+        self._run_logged("[TCP]", self.opt.autotuning, level, button=button)
 
     def _nagle_off(self):
-        ok, msg = self.opt.toggle_nagle(False)
-        self.log.append(f"[Nagle] {msg}")
+        self._run_logged("[Nagle]", self.opt.toggle_nagle, False)
 
     def _ping(self):
-        ok, out = self.opt.latency_ping("1.1.1.1", 5)
-        self.log.append(out)
+        self._run_logged("", self.opt.latency_ping, "1.1.1.1", 5)
 
     def _startup_list(self):
-        items = self.opt.list_startup_entries()
+        self._run_async(
+            self.btn_list_startup, self.opt.list_startup_entries,
+            self._show_startup_entries,
+        )
+
+    def _show_startup_entries(self, items):
         if not items:
-            self.log.append("No startup entries found.")
+            self._log("No startup entries found.")
             return
-        self.log.append("Startup Entries:")
-        for loc, name, val in items:
-            self.log.append(f"- {name} → {val}")
+        # One append (one layout pass) for the whole block
+        lines = ["Startup Entries:"]
+        lines.extend(f"- {name} → {val}" for loc, name, val in items)
+        self._log("\n".join(lines))
 
     # STORAGE
+    # Disk walks: run off-thread; the button stays disabled until done so
+    # repeated clicks can't queue up duplicate scans.
     def _analyze_drive(self):
-        result = self.opt.analyze_drive()
-        self.log.append(result)
+        self._run_async(self.btn_analyze_drive, self.opt.analyze_drive, self._log)
 
     def _top25(self):
-        result = self.opt.analyze_top25()
-        self.log.append(result)
+        self._run_async(self.btn_top25, self.opt.analyze_top25, self._log)
 
     def _top_dirs(self):
-        result = self.opt.analyze_top_dirs()
-        self.log.append(result)
+        self._run_async(self.btn_top_dirs, self.opt.analyze_top_dirs, self._log)
 
     def _clear_cache(self):
-        result = self.opt.clear_cache()
-        self.log.append(result)
+        self._run_async(self.btn_clear_cache, self.opt.clear_cache, self._log)
 
     # PROFILES
-    def _apply_profile(self, name: str):
+    def _apply_profile(self, button, name: str):
+        self._run_async(button, self._profile_report, self._log, self.opt, name)
+
+    @staticmethod
+    def _profile_report(opt, name: str) -> str:
+        """
+        Apply a built-in preset (pool thread); returns the log block.
+        `opt` is resolved on the GUI thread by the caller.
+        """
         msgs = []
 
         if name == "gaming":
-            ok, m = self.opt.create_high_perf_powerplan()
+            ok, m = opt.create_high_perf_powerplan()
             msgs.append(f"[Power] {m}")
 
-            ok, m = self.opt.set_dns("1.1.1.1", "1.0.0.1")
+            ok, m = opt.set_dns("1.1.1.1", "1.0.0.1")
             msgs.append(f"[DNS] {m}")
 
-            ok, m = self.opt.enable_ctcp(True)
+            ok, m = opt.enable_ctcp(True)
             msgs.append(f"[CTCP] {m}")
 
-            ok, m = self.opt.autotuning("restricted")
+            ok, m = opt.autotuning("restricted")
             msgs.append(f"[TCP] {m}")
 
-            ok, m = self.opt.toggle_nagle(False)
+            ok, m = opt.toggle_nagle(False)
             msgs.append(f"[Nagle] {m}")
 
             header = "[Profile] Applied Gaming preset"
 
         elif name == "productivity":
-            ok, m = self.opt.autotuning("normal")
+            ok, m = opt.autotuning("normal")
             msgs.append(f"[TCP] {m}")
 
-            ok, m = self.opt.enable_ctcp(False)
+            ok, m = opt.enable_ctcp(False)
             msgs.append(f"[CTCP] {m}")
 
             try:
-                ok, m = self.opt.toggle_nagle(True)
+                ok, m = opt.toggle_nagle(True)
                 msgs.append(f"[Nagle] {m}")
             except TypeError:
                 msgs.append("[Nagle] Left at current setting")
@@ -456,24 +471,21 @@ class WindowsPage(QWidget):
             header = "[Profile] Applied Productivity preset"
 
         elif name == "streaming":
-            ok, m = self.opt.create_high_perf_powerplan()
+            ok, m = opt.create_high_perf_powerplan()
             msgs.append(f"[Power] {m}")
 
-            ok, m = self.opt.autotuning("normal")
+            ok, m = opt.autotuning("normal")
             msgs.append(f"[TCP] {m}")
 
-            ok, m = self.opt.enable_ctcp(True)
+            ok, m = opt.enable_ctcp(True)
             msgs.append(f"[CTCP] {m}")
 
             header = "[Profile] Applied Streaming preset"
 
         else:
-            self.log.append(f"[Profile] Unknown profile '{name}'")
-            return
+            return f"[Profile] Unknown profile '{name}'"
 
-        self.log.append(header)
-        for line in msgs:
-            self.log.append("  " + line)
+        return "\n".join([header, *("  " + line for line in msgs)])
 
     def _save_profile(self):
         path, _ = QFileDialog.getSaveFileName(
@@ -483,14 +495,17 @@ class WindowsPage(QWidget):
             "QrsTweaks Profile (*.qrsp);;JSON Files (*.json);;All Files (*.*)",
         )
         if not path:
-            self.log.append("[Profile] Save cancelled.")
+            self._log("[Profile] Save cancelled.")
             return
 
-        ok, msg = self.opt.export_profile(path)
-        if ok:
-            self.log.append(f"[Profile] Saved to {path}")
-        else:
-            self.log.append(f"[Profile] Save failed: {msg}")
+        def done(result):
+            ok, msg = result
+            if ok:
+                self._log(f"[Profile] Saved to {path}")
+            else:
+                self._log(f"[Profile] Save failed: {msg}")
+
+        self._run_async(self.btn_prof_save, self.opt.export_profile, done, path)
 
     def _load_profile(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -500,84 +515,65 @@ class WindowsPage(QWidget):
             "QrsTweaks Profile (*.qrsp);;JSON Files (*.json);;All Files (*.*)",
         )
         if not path:
-            self.log.append("[Profile] Load cancelled.")
+            self._log("[Profile] Load cancelled.")
             return
 
-        ok, msg = self.opt.import_profile(path)
-        self.log.append(msg)
+        self._run_logged("", self.opt.import_profile, path)
 
     # REPAIR OPS
     def _repair_wu(self):
-        ok, msg = self.opt.repair_windows_update()
-        self.log.append(msg)
+        self._run_logged("", self.opt.repair_windows_update)
 
     def _reset_net(self):
-        ok, msg = self.opt.reset_network_stack()
-        self.log.append(msg)
+        self._run_logged("", self.opt.reset_network_stack)
 
     def _run_dism_sfc(self):
-        ok, msg = self.opt.run_dism_sfc()
-        self.log.append(msg)
+        self._run_logged("", self.opt.run_dism_sfc)
 
     def _reset_store_cache(self):
-        ok, msg = self.opt.reset_store_cache()
-        self.log.append(msg)
+        self._run_logged("", self.opt.reset_store_cache)
 
     # DEBLOAT
     def _debloat_xbox(self):
-        ok, msg = self.opt.debloat_xbox_gamebar()
-        self.log.append(msg)
+        self._run_logged("", self.opt.debloat_xbox_gamebar)
 
     def _debloat_bg_apps(self):
-        ok, msg = self.opt.debloat_background_apps()
-        self.log.append(msg)
+        self._run_logged("", self.opt.debloat_background_apps)
 
     def _debloat_telemetry(self):
-        ok, msg = self.opt.debloat_telemetry_safe()
-        self.log.append(msg)
+        self._run_logged("", self.opt.debloat_telemetry_safe)
 
     def _debloat_cortana(self):
-        ok, msg = self.opt.debloat_cortana_search()
-        self.log.append(msg)
+        self._run_logged("", self.opt.debloat_cortana_search)
 
     def _debloat_revert(self):
-        ok, msg = self.opt.debloat_revert_safe()
-        self.log.append(msg)
+        self._run_logged("", self.opt.debloat_revert_safe)
 
     # UI TWEAKS
     def _ui_disable_bing(self):
-        ok, msg = self.opt.ui_disable_bing_search()
-        self.log.append(msg)
+        self._run_logged("", self.opt.ui_disable_bing_search)
 
     def _ui_disable_widgets(self):
-        ok, msg = self.opt.ui_hide_widgets()
-        self.log.append(msg)
+        self._run_logged("", self.opt.ui_hide_widgets)
 
     def _ui_disable_chat(self):
-        ok, msg = self.opt.ui_hide_chat_icon()
-        self.log.append(msg)
+        self._run_logged("", self.opt.ui_hide_chat_icon)
 
     def _ui_explorer_thispc(self):
-        ok, msg = self.opt.ui_explorer_this_pc()
-        self.log.append(msg)
+        self._run_logged("", self.opt.ui_explorer_this_pc)
 
     def _ui_show_ext(self):
-        ok, msg = self.opt.ui_show_file_extensions()
-        self.log.append(msg)
+        self._run_logged("", self.opt.ui_show_file_extensions)
 
     def _ui_restore_ui(self):
-        ok, msg = self.opt.ui_restore_defaults()
-        self.log.append(msg)
+        self._run_logged("", self.opt.ui_restore_defaults)
 
     # BACKUP
     def _backup_create(self):
-        ok, msg = self.opt.create_backup_snapshot()
-        self.log.append(msg)
+        self._run_logged("", self.opt.create_backup_snapshot)
 
     def _backup_restore(self):
-        ok, msg = self.opt.restore_latest_backup()
-        self.log.append(msg)
+        self._run_logged("", self.opt.restore_latest_backup)
 
     def _backup_open(self):
-        ok, msg = self.opt.open_backup_folder()
-        self.log.append(msg)
+        self._run_logged("", self.opt.open_backup_folder)
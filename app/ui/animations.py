@@ -1,6 +1,13 @@
+import os
+
 from PySide6.QtCore import QPropertyAnimation, QEasingCurve
 
+# QRS_NO_ANIM=1 (reduced motion / headless) turns every helper into a no-op,
+# so no animation timers run at all.
+_ANIMATE = os.environ.get("QRS_NO_ANIM") != "1"
+
 def fade_in(widget, ms=180):
+    if not _ANIMATE: return
     widget.setWindowOpacity(0.0)
     anim = QPropertyAnimation(widget, b"windowOpacity", widget)
     anim.setDuration(ms)
@@ -11,6 +18,7 @@ def fade_in(widget, ms=180):
     _stash(widget, anim)
 
 def slide_in_y(widget, start_y_delta=16, ms=220):
+    if not _ANIMATE: return
     geo = widget.geometry()
     anim = QPropertyAnimation(widget, b"geometry", widget)
     anim.setDuration(ms)
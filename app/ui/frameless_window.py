@@ -5,86 +5,99 @@ from PySide6.QtCore import Qt, QEvent, QRectF, Signal
 from PySide6.QtGui import QMouseEvent, QPainter, QColor, QPainterPath
 
 
+# Title bar look, parsed once on the TitleBar and cascaded to its
+# children by objectName / property instead of one setStyleSheet each.
+_TITLEBAR_QSS = """
+    QLabel#TitleLabel { color:#DDE1EA; font-size:11.5pt; font-weight:700; }
+
+    QComboBox#ProfileCombo {
+        color: #DDE1EA;
+        background: rgba(255,255,255,0.08);
+        border: 1px solid rgba(255,255,255,0.18);
+        border-radius: 6px;
+        padding: 2px 8px;
+    }
+    QComboBox#ProfileCombo::drop-down {
+        width: 24px;
+        border-left: 1px solid rgba(255,255,255,0.18);
+    }
+    QComboBox#ProfileCombo:hover {
+        background: rgba(255,255,255,0.14);
+    }
+    QComboBox#ProfileCombo QAbstractItemView {
+        color:#DDE1EA;
+        background: rgba(24,26,32,0.95);
+        selection-background-color: rgba(120,200,255,0.25);
+        border: 1px solid rgba(255,255,255,0.12);
+    }
+
+    QPushButton#ApplyProfile {
+        color:#EAF2FF;
+        background: rgba(120,200,255,0.18);
+        border: 1px solid rgba(120,200,255,0.35);
+        border-radius: 6px;
+        padding: 4px 10px;
+        font-weight: 600;
+    }
+    QPushButton#ApplyProfile:hover {
+        background: rgba(120,200,255,0.28);
+    }
+
+    QPushButton[winBtn="true"] {
+        background: rgba(255,255,255,0.06);
+        border-radius: 6px;
+        color: #DDE1EA;
+        font-weight: 600;
+    }
+    QPushButton[winBtn="true"]:hover {
+        background: rgba(255,255,255,0.18);
+    }
+"""
+
+
+def _mkbtn(text: str) -> QPushButton:
+    """Window-control button; styled by _TITLEBAR_QSS via its winBtn property."""
+    b = QPushButton(text)
+    b.setProperty("winBtn", True)
+    b.setFixedSize(32, 32)
+    b.setFlat(True)
+    return b
+
+
 class TitleBar(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
         self._drag_pos = None
         self.setFixedHeight(44)
+        self.setStyleSheet(_TITLEBAR_QSS)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 0, 12, 0)
         layout.setSpacing(10)
 
         self.label = QLabel("QrsTweaks")
-        self.label.setStyleSheet("color:#DDE1EA; font-size:11.5pt; font-weight:700;")
+        self.label.setObjectName("TitleLabel")
         layout.addWidget(self.label)
         layout.addStretch()
 
         # ---- Profile combo + Apply button (top-right) ----
         self.profile_combo = QComboBox()
+        self.profile_combo.setObjectName("ProfileCombo")
         self.profile_combo.addItems(["Gaming Mode", "Productivity Mode", "Streaming Mode"])
         self.profile_combo.setCurrentIndex(0)  # Reset to Gaming on launch
         self.profile_combo.setFixedHeight(30)
-        self.profile_combo.setStyleSheet("""
-            QComboBox {
-                color: #DDE1EA;
-                background: rgba(255,255,255,0.08);
-                border: 1px solid rgba(255,255,255,0.18);
-                border-radius: 6px;
-                padding: 2px 8px;
-            }
-            QComboBox::drop-down {
-                width: 24px;
-                border-left: 1px solid rgba(255,255,255,0.18);
-            }
-            QComboBox:hover {
-                background: rgba(255,255,255,0.14);
-            }
-            QAbstractItemView {
-                color:#DDE1EA;
-                background: rgba(24,26,32,0.95);
-                selection-background-color: rgba(120,200,255,0.25);
-                border: 1px solid rgba(255,255,255,0.12);
-            }
-        """)
 
         self.btn_apply_profile = QPushButton("Apply Profile")
+        self.btn_apply_profile.setObjectName("ApplyProfile")
         self.btn_apply_profile.setFixedHeight(30)
-        self.btn_apply_profile.setStyleSheet("""
-            QPushButton {
-                color:#EAF2FF;
-                background: rgba(120,200,255,0.18);
-                border: 1px solid rgba(120,200,255,0.35);
-                border-radius: 6px;
-                padding: 4px 10px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: rgba(120,200,255,0.28);
-            }
-        """)
         layout.addWidget(self.profile_combo)
         layout.addWidget(self.btn_apply_profile)
 
         # ---- Window buttons ----
-        self.btn_min = QPushButton("–")
-        self.btn_max = QPushButton("□")
-        self.btn_close = QPushButton("✕")
-
+        self.btn_min = _mkbtn("–")
+        self.btn_max = _mkbtn("□")
+        self.btn_close = _mkbtn("✕")
         for b in (self.btn_min, self.btn_max, self.btn_close):
-            b.setFixedSize(32, 32)
-            b.setFlat(True)
-            b.setStyleSheet("""
-                QPushButton {
-                    background: rgba(255,255,255,0.06);
-                    border-radius: 6px;
-                    color: #DDE1EA;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background: rgba(255,255,255,0.18);
-                }
-            """)
             layout.addWidget(b)
 
         self.btn_close.clicked.connect(self.window().close)
@@ -0,0 +1,19 @@
+# app/ui/styles.py
+"""
+Shared inline stylesheet strings.
+
+Pages pass these constants to setStyleSheet() instead of repeating the
+literals, so every widget with the same look references the same
+string object.
+"""
+
+TRANSPARENT_CSS = "background: transparent;"
+
+PAGE_TITLE_CSS = "font-size: 22pt; color: #DDE1EA; font-weight: 700;"
+
+HINT_CSS = "color:#AAB0BC; font-size:10pt;"
+NOTE_CSS = "color:#AAB0BC; font-size:9pt;"
+
+STATUS_PENDING_CSS = "color:#FFA500; font-weight:600;"
+STATUS_OK_CSS = "color:#44DD44; font-weight:600;"
+STATUS_ERR_CSS = "color:#FF5555; font-weight:600;"
@@ -1,3 +1,5 @@
+from functools import partial
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -87,10 +89,10 @@ class SuiteWindow(FramelessWindow):
         self.stack.addWidget(self.page_pass)
 
         # Navigation wiring
-        self.btn_dash.clicked.connect(lambda: self._switch_page(0))
-        self.btn_win.clicked.connect(lambda: self._switch_page(1))
-        self.btn_games.clicked.connect(lambda: self._switch_page(2))
-        self.btn_pass.clicked.connect(lambda: self._switch_page(3))
+        self.btn_dash.clicked.connect(partial(self._switch_page, 0))
+        self.btn_win.clicked.connect(partial(self._switch_page, 1))
+        self.btn_games.clicked.connect(partial(self._switch_page, 2))
+        self.btn_pass.clicked.connect(partial(self._switch_page, 3))
 
         # Default page
         self.btn_dash.setChecked(True)
@@ -98,7 +100,8 @@ class SuiteWindow(FramelessWindow):
 
         QTimer.singleShot(300, self._initial_layout_fix)
 
-    def _switch_page(self, index: int) -> None:
+    def _switch_page(self, index: int, _checked: bool = False) -> None:
+        # _checked absorbs QPushButton.clicked(bool) when bound via partial
         for i, b in enumerate(self._nav_buttons):
             b.setChecked(i == index)
 
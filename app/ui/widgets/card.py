@@ -1,9 +1,9 @@
-from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel, QWidget
+from PySide6.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QWidget
 from PySide6.QtCore import Qt
 
 
 class Card(QFrame):
-    def __init__(self, title: str = "", parent=None):
+    def __init__(self, title: str = "", parent=None, horizontal: bool = False):
         super().__init__(parent)
         self.setObjectName("Card")
 
@@ -23,7 +23,10 @@ class Card(QFrame):
         # This avoids Qt duplicating children inside ScrollAreas.
         # ------------------------------------------------------------
         self._body_container = QWidget()
-        self._body_layout = QVBoxLayout(self._body_container)
+        # horizontal=True lays the body out as a row, for cards that would
+        # otherwise nest a single QHBoxLayout inside the body.
+        body_cls = QHBoxLayout if horizontal else QVBoxLayout
+        self._body_layout = body_cls(self._body_container)
         self._body_layout.setContentsMargins(0, 0, 0, 0)
         self._body_layout.setSpacing(10)
 
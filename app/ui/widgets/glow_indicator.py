@@ -13,10 +13,25 @@ class GlowIndicator(QWidget):
         self._enabled = True
         self.setFixedSize(20, 20)
 
-        # Smooth glow animation
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._updatePulse)
-        self.timer.start(40)
+        # Smooth glow animation; the timer is created on first show and
+        # only runs while the indicator is visible.
+        self.timer = None
+
+    def _ensure_timer(self):
+        if self.timer is None:
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self._updatePulse)
+        return self.timer
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._enabled and not self._ensure_timer().isActive():
+            self.timer.start(40)
+
+    def hideEvent(self, event):
+        if self.timer is not None:
+            self.timer.stop()
+        super().hideEvent(event)
 
     def _updatePulse(self):
         if not self._enabled:
@@ -45,9 +60,10 @@ class GlowIndicator(QWidget):
     def setEnabled(self, enabled: bool):
         self._enabled = enabled
         if not enabled:
-            self.timer.stop()
-        else:
-            if not self.timer.isActive():
+            if self.timer is not None:
+                self.timer.stop()
+        elif self.isVisible():
+            if not self._ensure_timer().isActive():
                 self.timer.start(40)
         self.update()
 
@@ -0,0 +1,99 @@
+# app/ui/widgets/log_view.py
+from functools import lru_cache
+
+from PySide6.QtWidgets import QPlainTextEdit
+from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
+from PySide6.QtCore import QTimer
+
+# Line levels understood by append_line(); None keeps the widget's
+# default text colour.
+LOG_COLORS = {
+    "inf": "#DDE1EA",
+    "ok": "#44dd44",
+    "warn": "#ffcc44",
+    "err": "#ff4444",
+}
+
+
+@lru_cache(maxsize=8)
+def _level_format(level: str | None) -> QTextCharFormat:
+    # One shared format per level; inserting with it is a plain
+    # attribute copy, no HTML/CSS parsing per line.
+    fmt = QTextCharFormat()
+    if level is not None:
+        fmt.setForeground(QColor(LOG_COLORS[level]))
+    return fmt
+
+
+class LogView(QPlainTextEdit):
+    """
+    Read-only plain-text log that batches appends.
+
+    append_line(text, level) only queues the line; a short single-shot
+    timer then inserts everything queued so far in one edit block, so a
+    burst of log lines costs one relayout/repaint instead of one per line.
+    Colour comes from a per-level QTextCharFormat, so there is no rich
+    text to parse. Oldest lines are dropped past `max_blocks`.
+
+    While the widget is hidden nothing is painted: lines stay queued
+    (trimmed to `max_blocks`) and are flushed when it is shown again.
+    """
+
+    FLUSH_MS = 16
+
+    def __init__(self, max_blocks: int = 500, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)  # read-only: an undo stack is dead weight
+        self.setMaximumBlockCount(max_blocks)
+        self._max_blocks = max_blocks
+
+        self._buf: list[tuple[str, str | None]] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def append_line(self, text: str, level: str | None = None) -> None:
+        """Queue `text` (newlines kept) coloured by `level` from LOG_COLORS."""
+        self._buf.append((text, level))
+        if not self.isVisible():
+            if len(self._buf) > self._max_blocks:
+                del self._buf[:-self._max_blocks]
+            return
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def append_text(self, text: str) -> None:
+        """Queue plain text in the default colour."""
+        self.append_line(text)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._buf and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def clear(self) -> None:
+        self._buf.clear()
+        super().clear()
+
+    def flush(self) -> None:
+        if not self._buf:
+            return
+        buf, self._buf = self._buf, []
+
+        cur = QTextCursor(self.document())
+        cur.movePosition(QTextCursor.End)
+        first = self.document().isEmpty()
+
+        cur.beginEditBlock()
+        for text, level in buf:
+            if first:
+                first = False
+            else:
+                cur.insertBlock()
+            cur.insertText(text, _level_format(level))
+        cur.endEditBlock()
+
+        bar = self.verticalScrollBar()
+        bar.setValue(bar.maximum())
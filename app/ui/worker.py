@@ -0,0 +1,60 @@
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+
+class WorkerSignals(QObject):
+    """
+    Signals for Worker. Created on the GUI thread, so slots connected
+    here run back on the GUI thread (queued) when emitted from the pool.
+
+    done(ok, result): result is the return value, or the exception if ok is False.
+    progress(item): one item yielded by an IterWorker's generator.
+    """
+    done = Signal(bool, object)
+    progress = Signal(object)
+
+
+class Worker(QRunnable):
+    """
+    Run `fn(*args, **kwargs)` on a QThreadPool thread.
+
+    Usage:
+        w = Worker(self.vault.load_or_create, pwd)
+        w.signals.done.connect(self._on_unlocked)
+        QThreadPool.globalInstance().start(w)
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    @Slot()
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.done.emit(False, e)
+        else:
+            self.signals.done.emit(True, result)
+
+
+class IterWorker(Worker):
+    """
+    Like Worker, but `fn` returns an iterator: each yielded item is
+    emitted via signals.progress as soon as it is produced, then
+    done(True, count) fires once the iterator is exhausted.
+    """
+
+    @Slot()
+    def run(self):
+        count = 0
+        try:
+            for item in self.fn(*self.args, **self.kwargs):
+                self.signals.progress.emit(item)
+                count += 1
+        except Exception as e:
+            self.signals.done.emit(False, e)
+        else:
+            self.signals.done.emit(True, count)
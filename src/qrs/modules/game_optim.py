@@ -20,32 +20,209 @@ Everything here is designed to be **safe by default**:
 - Fails gracefully on non-Windows systems
 """
 
+import ctypes
 import json
 import os
 import shutil
 import subprocess
 import platform
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple, Dict, NamedTuple, List, Optional
+from typing import Tuple, Dict, NamedTuple, List, Optional, Iterator
 
 try:
     import psutil  # type: ignore
 except ImportError:  # pragma: no cover - optional
     psutil = None
 
+try:
+    import winreg  # type: ignore
+except ImportError:  # pragma: no cover - non-Windows
+    winreg = None
+
 from .game_profile import GameProfile
 
+# Registry values written by disable_recording_stack(), grouped per key so
+# each key is opened once.
+_RECORDING_VALUES: Tuple[Tuple[str, Tuple[Tuple[str, int], ...]], ...] = (
+    (
+        r"SOFTWARE\Microsoft\Windows\CurrentVersion\GameDVR",
+        (("AppCaptureEnabled", 0),),
+    ),
+    (
+        r"System\GameConfigStore",
+        (
+            ("GameDVR_Enabled", 0),
+            ("GameDVR_DSEBehavior", 2),
+            ("AllowGameDVR", 0),
+        ),
+    ),
+)
+
 
 class ProcessInfo(NamedTuple):
     pid: int
     name: str
+    rss: int = 0
 
 
 def _is_windows() -> bool:
     return platform.system() == "Windows"
 
 
+@contextmanager
+def _thread_affinity(cores: List[int]):
+    """
+    Restrict the *calling thread* to `cores` for the duration of the
+    block, then restore its previous mask. Best-effort: does nothing if
+    `cores` is empty or the platform call fails.
+    """
+    if not cores:
+        yield
+        return
+
+    restore = None
+    try:
+        if _is_windows():
+            k32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+            k32.GetCurrentThread.restype = ctypes.c_void_p
+            k32.SetThreadAffinityMask.restype = ctypes.c_size_t
+            k32.SetThreadAffinityMask.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+            mask = 0
+            for c in cores:
+                if c < 64:
+                    mask |= 1 << c
+            if mask:
+                prev = k32.SetThreadAffinityMask(k32.GetCurrentThread(), mask)
+                if prev:
+                    restore = lambda: k32.SetThreadAffinityMask(k32.GetCurrentThread(), prev)
+        elif hasattr(os, "sched_setaffinity"):
+            # pid 0 == calling thread on Linux
+            prev_set = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, cores)
+            restore = lambda: os.sched_setaffinity(0, prev_set)
+    except Exception:
+        restore = None
+
+    try:
+        yield
+    finally:
+        if restore is not None:
+            try:
+                restore()
+            except Exception:
+                pass
+
+
+# Ceiling for find_game_process()'s backoff between scans (seconds)
+_POLL_MAX_INTERVAL = 15.0
+
+# Thread access rights needed by SetThreadGroupAffinity
+_THREAD_SET_INFORMATION = 0x0020
+_THREAD_QUERY_INFORMATION = 0x0040
+
+
+class _GROUP_AFFINITY(ctypes.Structure):
+    _fields_ = [
+        ("Mask", ctypes.c_size_t),
+        ("Group", ctypes.c_ushort),
+        ("Reserved", ctypes.c_ushort * 3),
+    ]
+
+
+@lru_cache(maxsize=1)
+def _processor_group_masks() -> Tuple[int, ...]:
+    """
+    Full affinity mask of each active processor group (Windows). A single
+    group (<= 64 logical CPUs, or non-Windows) gives a 1-tuple, in which
+    case plain process affinity covers every CPU.
+    """
+    if not _is_windows():
+        return (0,)
+    try:
+        k32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        groups = int(k32.GetActiveProcessorGroupCount()) or 1
+        return tuple(
+            (1 << int(k32.GetActiveProcessorCount(g))) - 1
+            for g in range(groups)
+        )
+    except Exception:
+        return (0,)
+
+
+def _set_thread_group_affinity(tids: List[int], targets: List[Tuple[int, int]]) -> int:
+    """
+    Assign each thread id a (group, mask) from `targets`, round-robin.
+    Returns how many threads were updated.
+    """
+    k32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    k32.OpenThread.restype = ctypes.c_void_p
+    k32.SetThreadGroupAffinity.argtypes = (
+        ctypes.c_void_p, ctypes.POINTER(_GROUP_AFFINITY), ctypes.c_void_p,
+    )
+    k32.CloseHandle.argtypes = (ctypes.c_void_p,)
+
+    access = _THREAD_SET_INFORMATION | _THREAD_QUERY_INFORMATION
+    done = 0
+    for i, tid in enumerate(tids):
+        group, mask = targets[i % len(targets)]
+        h = k32.OpenThread(access, False, tid)
+        if not h:
+            continue
+        try:
+            ga = _GROUP_AFFINITY(Mask=mask, Group=group)
+            if k32.SetThreadGroupAffinity(h, ctypes.byref(ga), None):
+                done += 1
+        finally:
+            k32.CloseHandle(h)
+    return done
+
+
+# SHFileOperationW: delete, no progress/confirmation/error dialogs,
+# no recycle bin (FOF_ALLOWUNDO left unset)
+_FO_DELETE = 0x0003
+_FOF_NO_UI = 0x0004 | 0x0010 | 0x0200 | 0x0400
+
+
+class _SHFILEOPSTRUCTW(ctypes.Structure):
+    _fields_ = [
+        ("hwnd", ctypes.c_void_p),
+        ("wFunc", ctypes.c_uint),
+        ("pFrom", ctypes.c_wchar_p),
+        ("pTo", ctypes.c_wchar_p),
+        ("fFlags", ctypes.c_ushort),
+        ("fAnyOperationsAborted", ctypes.c_int),
+        ("hNameMappings", ctypes.c_void_p),
+        ("lpszProgressTitle", ctypes.c_wchar_p),
+    ]
+
+
+def _shell_delete(paths: List[Path]) -> bool:
+    """
+    Delete `paths` (files or whole trees) with one SHFileOperationW call
+    instead of a Python unlink loop. Returns True only if the shell
+    reports complete success; callers fall back to the Python loop for
+    anything left behind.
+    """
+    if not paths or not _is_windows():
+        return False
+    # pFrom is a list of NUL-separated paths ending in a double NUL
+    buf = ctypes.create_unicode_buffer("\0".join(str(x) for x in paths) + "\0\0")
+    op = _SHFILEOPSTRUCTW(
+        wFunc=_FO_DELETE,
+        pFrom=ctypes.cast(buf, ctypes.c_wchar_p),
+        fFlags=_FOF_NO_UI,
+    )
+    try:
+        rc = ctypes.windll.shell32.SHFileOperationW(ctypes.byref(op))  # type: ignore[attr-defined]
+    except Exception:
+        return False
+    return rc == 0 and not op.fAnyOperationsAborted
+
+
 def _run_shell(cmd: str) -> Tuple[bool, str]:
     """
     Run a command through the shell and return (ok, combined_output).
@@ -73,6 +250,7 @@ class GameOptimizer:
       - app/pages/games_page.py instantiates this and calls methods like:
             disable_xbox_game_bar()
             disable_game_dvr()
+            disable_recording_stack()
             clean_fortnite_shader_cache()
             clean_fortnite_logs_and_crashes()
             clean_directx_cache()
@@ -87,12 +265,13 @@ class GameOptimizer:
     def __init__(self) -> None:
         # Profiles live under: <project_root>/profiles/games/*.qrsgame
         self.root = Path.cwd()
+        # Created on first save (save_profile_for_game mkdirs the parent),
+        # so constructing the optimizer touches no files.
         self.profiles_dir = self.root / "profiles" / "games"
-        try:
-            self.profiles_dir.mkdir(parents=True, exist_ok=True)
-        except Exception:
-            # Non-fatal; we will error at write-time instead
-            pass
+
+        # psutil.Process handles by PID, reused across priority/affinity
+        # calls instead of re-opening the process every time.
+        self._proc_cache: Dict[int, "psutil.Process"] = {}
 
     # =========================================================
     #   XBOX GAME BAR / DVR
@@ -145,6 +324,39 @@ class GameOptimizer:
         msg = "Game DVR disabled.\n" + "\n\n".join(logs)
         return ok_all, msg
 
+    def disable_recording_stack(self) -> Tuple[bool, str]:
+        """
+        Disable Game Bar capture and background Game DVR in one pass.
+
+        Writes the same values as disable_xbox_game_bar() +
+        disable_game_dvr(), but through winreg with one handle per key
+        instead of one `reg add` process per value.
+        """
+        if not _is_windows():
+            return False, "Not running on Windows; cannot tweak Game Bar / DVR."
+
+        if winreg is None:
+            ok1, msg1 = self.disable_xbox_game_bar()
+            ok2, msg2 = self.disable_game_dvr()
+            return ok1 and ok2, msg1 + "\n" + msg2
+
+        logs = []
+        ok_all = True
+        for subkey, values in _RECORDING_VALUES:
+            try:
+                with winreg.CreateKeyEx(
+                    winreg.HKEY_CURRENT_USER, subkey, 0, winreg.KEY_SET_VALUE
+                ) as key:
+                    for name, data in values:
+                        winreg.SetValueEx(key, name, 0, winreg.REG_DWORD, data)
+                        logs.append(f"HKCU\\{subkey}\\{name} = {data}")
+            except OSError as e:
+                ok_all = False
+                logs.append(f"HKCU\\{subkey}: {e!r}")
+
+        head = "Game Bar / DVR disabled." if ok_all else "Game Bar / DVR partially disabled."
+        return ok_all, head + "\n" + "\n".join(logs)
+
     # =========================================================
     #   FORTNITE-SPECIFIC CLEANUPS
     # =========================================================
@@ -190,17 +402,23 @@ class GameOptimizer:
             return 0
 
         count = 0
-        for child in p.iterdir():
-            try:
-                if child.is_dir():
-                    shutil.rmtree(child, ignore_errors=True)
-                else:
-                    if child.exists():
-                        child.unlink()
-                count += 1
-            except Exception:
-                # Best-effort only; permission issues are ignored
-                continue
+        # Keep the delete walk off the cores a running game is given
+        with _thread_affinity(self.get_cleanup_cores()):
+            children = list(p.iterdir())
+            if _shell_delete(children):
+                return len(children)
+
+            for child in children:
+                try:
+                    if child.is_dir():
+                        shutil.rmtree(child, ignore_errors=True)
+                    else:
+                        if child.exists():
+                            child.unlink()
+                    count += 1
+                except Exception:
+                    # Best-effort only; permission issues are ignored
+                    continue
         return count
 
     def clean_fortnite_shader_cache(self) -> Tuple[bool, str]:
@@ -279,31 +497,26 @@ class GameOptimizer:
     #   COMPOSED PRESET EXAMPLE (FORTNITE "GAMING" PRESET)
     # =========================================================
 
-    def apply_fortnite_gaming_preset(self) -> Tuple[bool, str]:
+    def iter_fortnite_gaming_preset(self) -> Iterator[Tuple[str, bool, str]]:
         """
-        Example helper that wires together:
-          - Disable Game Bar
-          - Disable Game DVR
+        Run the Fortnite preset one step at a time, yielding
+        (step_label, ok, msg) as each step finishes:
+          - Disable Game Bar / DVR
           - Clean Fortnite shader cache
           - Clean Fortnite logs/crashes
           - Clean DirectX cache
         """
-        steps: List[Tuple[str, bool, str]] = []
+        yield ("Game Bar / DVR", *self.disable_recording_stack())
+        yield ("Shader Cache", *self.clean_fortnite_shader_cache())
+        yield ("Logs/Crashes", *self.clean_fortnite_logs_and_crashes())
+        yield ("DirectX Cache", *self.clean_directx_cache())
 
-        ok_gb, msg_gb = self.disable_xbox_game_bar()
-        steps.append(("Game Bar", ok_gb, msg_gb))
-
-        ok_dvr, msg_dvr = self.disable_game_dvr()
-        steps.append(("Game DVR", ok_dvr, msg_dvr))
-
-        ok_sh, msg_sh = self.clean_fortnite_shader_cache()
-        steps.append(("Shader Cache", ok_sh, msg_sh))
-
-        ok_logs, msg_logs = self.clean_fortnite_logs_and_crashes()
-        steps.append(("Logs/Crashes", ok_logs, msg_logs))
-
-        ok_dx, msg_dx = self.clean_directx_cache()
-        steps.append(("DirectX Cache", ok_dx, msg_dx))
+    def apply_fortnite_gaming_preset(self) -> Tuple[bool, str]:
+        """
+        Same steps as iter_fortnite_gaming_preset(), collected into a
+        single (ok, msg) summary for callers that want one result.
+        """
+        steps = list(self.iter_fortnite_gaming_preset())
 
         ok_all = all(s[1] for s in steps)
         lines = []
@@ -378,23 +591,56 @@ class GameOptimizer:
 
         wanted = {n.lower() for n in names}
         found: list[ProcessInfo] = []
+        seen: set[int] = set()
 
         try:
             for p in psutil.process_iter(["pid", "name"]):  # type: ignore[attr-defined]
+                seen.add(p.pid)
                 try:
                     name = (p.info.get("name") or "").strip()
                     if not name:
                         continue
                     if name.lower() in wanted:
                         found.append(ProcessInfo(pid=p.info["pid"], name=name))
+                        self._proc_cache[p.pid] = p
                 except (psutil.NoSuchProcess, psutil.AccessDenied):  # type: ignore[attr-defined]
                     continue
         except Exception:
             # Anything weird from psutil, just treat as "no processes"
             return []
 
+        # Drop cached handles for processes that have exited
+        # (snapshot the keys: pool workers may update the cache meanwhile)
+        for pid in list(self._proc_cache):
+            if pid not in seen:
+                self._proc_cache.pop(pid, None)
+
+        # rss is only needed to pick between several matches
+        if len(found) > 1:
+            found = [m._replace(rss=self._read_rss(m.pid)) for m in found]
+
         return found
 
+    def _read_rss(self, pid: int) -> int:
+        proc = self._proc_cache.get(pid)
+        if proc is None:
+            return 0
+        try:
+            return proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):  # type: ignore[attr-defined]
+            return 0
+
+    def _get_process(self, pid: int) -> "psutil.Process":
+        """
+        Return a cached psutil.Process for pid. is_running() also guards
+        against PID reuse (it compares creation time).
+        """
+        proc = self._proc_cache.get(pid)
+        if proc is None or not proc.is_running():
+            proc = psutil.Process(pid)  # type: ignore[attr-defined]
+            self._proc_cache[pid] = proc
+        return proc
+
     def find_game_process(
         self,
         game_label: str,
@@ -408,7 +654,8 @@ class GameOptimizer:
             game_label: Text shown in the Game combobox
             timeout_sec: How long to wait for the game to appear
                          0 = no waiting, just one scan
-            poll_interval: How often to recheck while waiting
+            poll_interval: Initial delay between rechecks while waiting;
+                           it backs off x1.5 per miss, up to 15s
 
         Returns:
             (ok, message, ProcessInfo or None)
@@ -425,26 +672,17 @@ class GameOptimizer:
         if not target_names:
             return False, f"No known process mapping for '{game_label}'.", None
 
-        import time as _time
-
-        deadline = _time.time() + max(timeout_sec, 0.0)
+        deadline = time.monotonic() + max(timeout_sec, 0.0)
         attempt = 0
+        interval = max(poll_interval, 0.1)
 
         while True:
             attempt += 1
             matches = self._iter_candidate_processes(target_names)
             if matches:
-                # Prefer the one with the highest memory usage if we can
-                best = matches[0]
-                try:
-                    if psutil is not None:
-                        best_proc = max(
-                            (psutil.Process(m.pid) for m in matches),  # type: ignore[attr-defined]
-                            key=lambda p: p.memory_info().rss,
-                        )
-                        best = ProcessInfo(pid=best_proc.pid, name=best_proc.name())
-                except Exception:
-                    best = matches[0]
+                # Prefer the one with the highest memory usage
+                # (rss is filled in only when there are several)
+                best = max(matches, key=lambda m: m.rss)
 
                 return (
                     True,
@@ -452,11 +690,15 @@ class GameOptimizer:
                     best,
                 )
 
-            if _time.time() >= deadline or timeout_sec <= 0:
+            now = time.monotonic()
+            if now >= deadline or timeout_sec <= 0:
                 pretty = ", ".join(target_names)
                 return False, f"No running process found for {game_label} ({pretty}).", None
 
-            _time.sleep(max(poll_interval, 0.1))
+            # Each miss means a full process scan; back off while the
+            # game still isn't up, but never sleep past the deadline.
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * 1.5, _POLL_MAX_INTERVAL)
 
     def wait_for_game(
         self,
@@ -512,7 +754,7 @@ class GameOptimizer:
 
         assert psutil is not None  # for type checkers
         try:
-            proc = psutil.Process(pid)  # type: ignore[attr-defined]
+            proc = self._get_process(pid)
             lvl = (level or "").upper()
 
             if lvl == "HIGH":
@@ -524,6 +766,9 @@ class GameOptimizer:
 
             proc.nice(priority)  # type: ignore[arg-type]
             return True, f"Priority set to {lvl} for PID {pid}."
+        except psutil.NoSuchProcess as e:  # type: ignore[attr-defined]
+            self._proc_cache.pop(pid, None)
+            return False, f"Failed to set priority for PID {pid}: {e!r}"
         except Exception as e:
             return False, f"Failed to set priority for PID {pid}: {e!r}"
 
@@ -563,6 +808,22 @@ class GameOptimizer:
         use = min(8, total)
         return list(range(use))
 
+    def get_cleanup_cores(self) -> List[int]:
+        """
+        Logical cores outside the recommended gaming set, for background
+        work such as cache cleanup. Empty when every core is a gaming
+        core (nothing to avoid) or CPU info is unavailable.
+        """
+        gaming = self._recommended_gaming_cores()
+        if not gaming or psutil is None:
+            return []
+        try:
+            total = psutil.cpu_count(logical=True) or 0  # type: ignore[attr-defined]
+        except Exception:
+            return []
+        taken = set(gaming)
+        return [c for c in range(total) if c not in taken]
+
     def set_cpu_affinity(self, pid: int, cores: List[int]) -> Tuple[bool, str]:
         """
         Apply CPU affinity to a PID using psutil.
@@ -580,9 +841,12 @@ class GameOptimizer:
 
         assert psutil is not None  # for type checkers
         try:
-            proc = psutil.Process(pid)  # type: ignore[attr-defined]
+            proc = self._get_process(pid)
             proc.cpu_affinity(cores)    # type: ignore[attr-defined]
             return True, f"Affinity set to cores={cores} for PID {pid}."
+        except psutil.NoSuchProcess as e:  # type: ignore[attr-defined]
+            self._proc_cache.pop(pid, None)
+            return False, f"Failed to set CPU affinity for PID {pid}: {e!r}"
         except Exception as e:
             return False, f"Failed to set CPU affinity for PID {pid}: {e!r}"
 
@@ -623,12 +887,41 @@ class GameOptimizer:
         if total <= 0:
             return False, "Could not determine CPU core count."
 
+        # >64 logical CPUs: process affinity only reaches one group, so
+        # spread the game's threads across every group instead.
+        masks = _processor_group_masks()
+        if len(masks) > 1:
+            return self._apply_thread_group_affinity(
+                pid, game_label, list(enumerate(masks))
+            )
+
         cores = list(range(total))
         ok2, msg = self.set_cpu_affinity(pid, cores)
         if ok2:
             return True, f"{msg} (game='{game_label}', preset='all cores')"
         return False, msg
 
+    def _apply_thread_group_affinity(
+        self, pid: int, game_label: str, targets: List[Tuple[int, int]]
+    ) -> Tuple[bool, str]:
+        assert psutil is not None  # for type checkers
+        try:
+            tids = [t.id for t in self._get_process(pid).threads()]
+        except psutil.NoSuchProcess as e:  # type: ignore[attr-defined]
+            self._proc_cache.pop(pid, None)
+            return False, f"Failed to read threads for PID {pid}: {e!r}"
+        except Exception as e:
+            return False, f"Failed to read threads for PID {pid}: {e!r}"
+
+        done = _set_thread_group_affinity(tids, targets)
+        if done == 0:
+            return False, f"Could not set group affinity on any thread of PID {pid}."
+        groups = sorted({g for g, _ in targets})
+        return True, (
+            f"Group affinity set on {done}/{len(tids)} threads of PID {pid} "
+            f"(groups={groups}, game='{game_label}')."
+        )
+
     # =========================================================
     #   GAME PROFILES V2 (.qrsgame)
     # =========================================================
@@ -784,7 +1077,8 @@ class GameOptimizer:
             lines.append(f"[DirectX] {msg}")
 
         # 4) CPU priority
-        priority = str(settings.get("cpu_priority", "HIGH"))
+        # Sustained HIGH can starve system threads; profiles must ask for it
+        priority = str(settings.get("cpu_priority", "ABOVE_NORMAL"))
         ok_prio, msg_prio = self.apply_game_priority(profile.game_label, priority)
         overall_ok = overall_ok and ok_prio
         lines.append(f"[CPU] {msg_prio}")
@@ -18,9 +18,24 @@ The GamesPage or caller must pass an already-constructed GameOptimizer.
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _dumps_indented(data) -> str:
+    """
+    Pretty-print JSON with 2-space indent; uses orjson when installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
 
 @dataclass
 class GameProfile:
@@ -71,13 +86,24 @@ def _normalize_actions(raw) -> List[str]:
 # Loading
 # ------------------------------------------------------------
 
+@lru_cache(maxsize=64)
+def _load_profile_raw(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a profile file. Keyed on (mtime_ns, size), so an edited file is
+    re-read automatically. The returned dict is shared; treat it as read-only.
+    """
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
 def load_game_profile(path: str | Path) -> Tuple[bool, str, Optional[GameProfile]]:
     p = Path(path)
-    if not p.exists():
+    try:
+        st = p.stat()
+    except OSError:
         return False, f"[Profile] File not found: {p}", None
 
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
+        data = _load_profile_raw(str(p), st.st_mtime_ns, st.st_size)
     except Exception as e:
         return False, f"[Profile] Failed to parse JSON: {e!r}", None
 
@@ -135,7 +161,7 @@ def save_game_profile(path: str | Path, profile: GameProfile) -> Tuple[bool, str
     }
 
     try:
-        p.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        p.write_text(_dumps_indented(data), encoding="utf-8")
         return True, f"[Profile] Saved to {p}"
     except Exception as e:
         return False, f"[Profile] Failed to write {p}: {e!r}"
@@ -180,7 +206,8 @@ def _apply_action_token(token: str, game_label: str, opt) -> Tuple[bool, str]:
 
     # CPU priority
     if base in ("cpu.priority", "game.cpu.priority", "priority"):
-        level = suffix or "HIGH"
+        # HIGH is opt-in (cpu.priority.high); a bare token means ABOVE_NORMAL
+        level = suffix or "ABOVE_NORMAL"
         return opt.apply_game_priority(game_label, level)
 
     if base in ("cpu.priority.high",):
@@ -1,47 +1,129 @@
+import base64
+import csv
 import json
+import os
 from pathlib import Path
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+# KDF parameters for newly created vaults. Existing vaults keep whatever
+# salt/iteration count is stored in their header.
+_KDF_ITERATIONS = 200_000
+_SALT_BYTES = 16
+_NONCE_BYTES = 12
+_CIPHER = "aes-256-gcm"
+
+
+def _derive_key(master_key: str, salt: bytes, iterations: int) -> bytes:
+    """
+    PBKDF2-HMAC-SHA256 via OpenSSL; returns the raw 32-byte key.
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=iterations,
+    )
+    return kdf.derive(master_key.encode())
 
 
 class PasswordVault:
     """
     Simple encrypted password vault for QrsTweaks.
     Stores entries as { site: { user, password } }
-    Encrypted using a master key.
+    Encrypted using a key derived from the master password.
+
+    On-disk format (JSON):
+        { "kdf": "pbkdf2-sha256", "salt": <b64>, "iterations": int,
+          "cipher": "aes-256-gcm", "nonce": <b64>, "data": <b64 ciphertext> }
     """
 
     def __init__(self):
         self.file = Path.home() / ".qrs_vault"
         self.key = None
+        self.salt = b""
+        self.iterations = _KDF_ITERATIONS
         self.data = {}
+        self._rows = None  # cached list_entries() result; reset on load/add
 
     # ---------- INTERNAL ----------
     def _get_cipher(self):
-        return Fernet(self.key)
+        return AESGCM(self.key)
 
     def _save(self):
-        cipher = self._get_cipher()
+        # Whole vault is one JSON blob -> one AEAD call
         raw = json.dumps(self.data).encode()
-        encrypted = cipher.encrypt(raw)
-        self.file.write_bytes(encrypted)
+        nonce = os.urandom(_NONCE_BYTES)
+        header = {
+            "kdf": "pbkdf2-sha256",
+            "salt": base64.b64encode(self.salt).decode("ascii"),
+            "iterations": self.iterations,
+            "cipher": _CIPHER,
+            "nonce": base64.b64encode(nonce).decode("ascii"),
+            "data": base64.b64encode(
+                self._get_cipher().encrypt(nonce, raw, None)
+            ).decode("ascii"),
+        }
+        payload = json.dumps(header).encode("utf-8")
+
+        # Single write to a sibling temp file, then atomic swap, so a crash
+        # mid-save never leaves a truncated vault behind.
+        tmp = self.file.with_name(self.file.name + ".tmp")
+        with open(tmp, "wb", buffering=1 << 16) as fh:
+            fh.write(payload)
+        os.replace(tmp, self.file)
 
     # ---------- PUBLIC ----------
     def load_or_create(self, master_key: str):
-        self.key = Fernet(master_key.encode().ljust(32, b"0")[:32])
-
         if not self.file.exists():
+            self.salt = os.urandom(_SALT_BYTES)
+            self.iterations = _KDF_ITERATIONS
+            self.key = _derive_key(master_key, self.salt, self.iterations)
             self.data = {}
+            self._rows = None
             self._save()
             return
 
-        encrypted = self.file.read_bytes()
-        cipher = self._get_cipher()
-        decrypted = cipher.decrypt(encrypted)
+        header = json.loads(self.file.read_text(encoding="utf-8"))
+        self.salt = base64.b64decode(header["salt"])
+        self.iterations = int(header["iterations"])
+        self.key = _derive_key(master_key, self.salt, self.iterations)
+
+        if header.get("cipher") != _CIPHER:
+            raise ValueError(f"Unsupported vault cipher: {header.get('cipher')!r}")
+        decrypted = self._get_cipher().decrypt(
+            base64.b64decode(header["nonce"]),
+            base64.b64decode(header["data"]),
+            None,
+        )
         self.data = json.loads(decrypted.decode())
+        self._rows = None
 
     def add_entry(self, site: str, user: str, password: str):
         self.data[site] = {"user": user, "password": password}
+        self._rows = None
         self._save()
 
     def list_entries(self):
-        return self.data
+        """
+        Return [(site, entry), ...]. Built once and reused until the
+        vault is reloaded or an entry is added.
+        """
+        if self._rows is None:
+            self._rows = list(self.data.items())
+        return self._rows
+
+    def export_csv(self, path: Path) -> int:
+        """
+        Write all entries as plaintext CSV (site, username, password).
+        Returns the number of rows written (header excluded).
+        """
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as fh:
+            w = csv.writer(fh)
+            w.writerow(("title", "username", "password"))
+            w.writerows(
+                (site, entry.get("user", ""), entry.get("password", ""))
+                for site, entry in self.data.items()
+            )
+        return len(self.data)
@@ -0,0 +1,30 @@
+# src/qrs/modules/services.py
+"""
+Process-wide backend instances.
+
+Pages call these getters instead of constructing optimizers themselves,
+so every page shares one instance (and whatever it caches internally).
+Imports happen on first call, keeping them off the startup path.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_windows_optimizer():
+    from .windows_optim import WindowsOptimizer
+    return WindowsOptimizer()
+
+
+@lru_cache(maxsize=1)
+def get_game_optimizer():
+    from .game_optim import GameOptimizer
+    return GameOptimizer()
+
+
+@lru_cache(maxsize=1)
+def get_telemetry():
+    from .telemetry import Telemetry
+    return Telemetry()
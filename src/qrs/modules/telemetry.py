@@ -7,7 +7,7 @@ Lightweight system telemetry backend for QrsTweaks.
 
 Provides a single class:
 
-    Telemetry().snapshot() -> dict
+    Telemetry().snapshot() -> TelemetrySnap
 
 The snapshot is designed to be safe:
     - Uses psutil when available
@@ -17,7 +17,7 @@ The snapshot is designed to be safe:
 
 import time
 import platform
-from typing import Any, Dict, List, Optional
+from typing import List, NamedTuple, Optional, Tuple
 
 try:
     import psutil  # type: ignore
@@ -30,32 +30,41 @@ try:
 except ImportError:  # pragma: no cover
     GPUtil = None  # type: ignore
 
+# psutil.cpu_percent(interval=None) measures since the previous call, so
+# samples taken back-to-back are meaningless; reuse the last one instead.
+_CPU_MIN_INTERVAL = 0.25
+# Process enumeration is the most expensive call here and the count
+# barely moves tick to tick.
+_PROC_COUNT_INTERVAL = 5.0
+
+
+class TelemetrySnap(NamedTuple):
+    """
+    One telemetry sample. Unsupported platforms get the defaults
+    (supported=False, zeros / None everywhere else).
+    """
+    supported: bool
+    timestamp: float
+    cpu_total: float = 0.0
+    cpu_per_core: Tuple[float, ...] = ()
+    ram_used: int = 0
+    ram_total: int = 0
+    ram_percent: float = 0.0
+    process_count: int = 0
+    boot_time: float = 0.0
+    uptime_sec: float = 0.0
+    gpu_usage: Optional[float] = None
+    gpu_mem_used: Optional[float] = None
+    gpu_mem_total: Optional[float] = None
+    gpu_temp: Optional[float] = None
+
 
 class Telemetry:
     """
     Collects lightweight system stats for the dashboard.
 
-    snapshot() returns a dict with keys like:
-
-        {
-          "supported": True/False,
-          "timestamp": float,
-          "cpu_total": float,
-          "cpu_per_core": List[float],
-          "ram_used": int,
-          "ram_total": int,
-          "ram_percent": float,
-          "swap_used": int,
-          "swap_total": int,
-          "swap_percent": float,
-          "process_count": int,
-          "boot_time": float,
-          "uptime_sec": float,
-          "gpu_usage": Optional[float],
-          "gpu_mem_used": Optional[float],
-          "gpu_mem_total": Optional[float],
-          "gpu_temp": Optional[float],
-        }
+    snapshot() returns a TelemetrySnap; read fields as attributes
+    (snap.cpu_total, snap.ram_used, ...).
     """
 
     def __init__(self) -> None:
@@ -63,33 +72,24 @@ class Telemetry:
         self._psutil_ok = psutil is not None
         self._supported = self._is_windows and self._psutil_ok
 
+        self._boot_time: Optional[float] = None
+        self._cpu_at = 0.0
+        self._cpu_cache: Tuple[float, Tuple[float, ...]] = (0.0, ())
+        self._proc_at = 0.0
+        self._proc_count = 0
+        self._last: Optional[TelemetrySnap] = None
+
     @property
     def supported(self) -> bool:
         return self._supported
 
-    def snapshot(self) -> Dict[str, Any]:
-        """
-        Take a single telemetry snapshot.
-
-        Returns:
-            dict of metrics; when unsupported, contains only:
-                { "supported": False, "timestamp": ... }
-        """
-        now = time.time()
-        data: Dict[str, Any] = {
-            "supported": self._supported,
-            "timestamp": now,
-        }
-
-        if not self._supported:
-            # Minimal payload so the UI can show a nice message
-            return data
-
-        assert psutil is not None  # for type checker
+    # -------------------------------
+    # Cached / rate-limited samplers
+    # -------------------------------
+    def _sample_cpu(self, now: float) -> Tuple[float, Tuple[float, ...]]:
+        if self._cpu_at and now - self._cpu_at < _CPU_MIN_INTERVAL:
+            return self._cpu_cache
 
-        # -------------------------------
-        # CPU
-        # -------------------------------
         try:
             # One call, per-core; we derive total from the average.
             per_core: List[float] = psutil.cpu_percent(interval=None, percpu=True)  # type: ignore[attr-defined]
@@ -105,47 +105,74 @@ class Telemetry:
             except Exception:
                 cpu_total = 0.0
 
-        data["cpu_total"] = cpu_total
-        data["cpu_per_core"] = per_core
+        self._cpu_at = now
+        self._cpu_cache = (cpu_total, tuple(per_core))
+        return self._cpu_cache
+
+    def _get_boot_time(self, now: float) -> float:
+        # Boot time is fixed for the life of the process
+        if self._boot_time is None:
+            try:
+                self._boot_time = float(psutil.boot_time())  # type: ignore[attr-defined]
+            except Exception:
+                return now
+        return self._boot_time
+
+    def _get_process_count(self, now: float) -> int:
+        if not self._proc_at or now - self._proc_at >= _PROC_COUNT_INTERVAL:
+            try:
+                self._proc_count = len(psutil.pids())  # type: ignore[attr-defined]
+            except Exception:
+                self._proc_count = 0
+            self._proc_at = now
+        return self._proc_count
+
+    def latest(self, max_age: float = 1.0) -> TelemetrySnap:
+        """
+        Return the most recent snapshot if it is younger than max_age
+        seconds, otherwise take a new one. Lets other pages read the
+        dashboard's numbers without polling psutil again.
+        """
+        last = self._last
+        if last is not None and time.time() - last.timestamp < max_age:
+            return last
+        return self.snapshot()
+
+    def snapshot(self) -> TelemetrySnap:
+        """
+        Take a single telemetry snapshot.
+
+        Returns:
+            TelemetrySnap; when unsupported only `supported` (False) and
+            `timestamp` are meaningful.
+        """
+        now = time.time()
+
+        if not self._supported:
+            # Minimal payload so the UI can show a nice message
+            return TelemetrySnap(supported=False, timestamp=now)
+
+        assert psutil is not None  # for type checker
+
+        # -------------------------------
+        # CPU
+        # -------------------------------
+        cpu_total, per_core = self._sample_cpu(now)
 
         # -------------------------------
-        # RAM / SWAP
+        # RAM
         # -------------------------------
         try:
             vm = psutil.virtual_memory()  # type: ignore[attr-defined]
-            sm = psutil.swap_memory()     # type: ignore[attr-defined]
-
-            data["ram_used"] = int(vm.used)
-            data["ram_total"] = int(vm.total)
-            data["ram_percent"] = float(vm.percent)
-
-            data["swap_used"] = int(sm.used)
-            data["swap_total"] = int(sm.total)
-            data["swap_percent"] = float(sm.percent)
+            ram_used, ram_total, ram_percent = int(vm.used), int(vm.total), float(vm.percent)
         except Exception:
-            data.setdefault("ram_used", 0)
-            data.setdefault("ram_total", 0)
-            data.setdefault("ram_percent", 0.0)
-            data.setdefault("swap_used", 0)
-            data.setdefault("swap_total", 0)
-            data.setdefault("swap_percent", 0.0)
+            ram_used, ram_total, ram_percent = 0, 0, 0.0
 
         # -------------------------------
         # System / uptime
         # -------------------------------
-        try:
-            boot_time = float(psutil.boot_time())  # type: ignore[attr-defined]
-        except Exception:
-            boot_time = now
-
-        data["boot_time"] = boot_time
-        data["uptime_sec"] = max(0.0, now - boot_time)
-
-        try:
-            proc_count = len(psutil.pids())  # type: ignore[attr-defined]
-        except Exception:
-            proc_count = 0
-        data["process_count"] = proc_count
+        boot_time = self._get_boot_time(now)
+        proc_count = self._get_process_count(now)
 
         # -------------------------------
         # GPU (best effort)
@@ -156,13 +183,6 @@ class Telemetry:
         gpu_mem_total: Optional[float] = None
 
         if GPUtil is not None:
-            try:
-                gpus = GPUtil.getGPUs()  # type: ignore[attr-defined]
-                if gpus:
-                    g = gups[0]  # type: ignore[name-defined]
-            except Exception:
-                g = None
-
             try:
                 gpus = GPUtil.getGPUs()  # type: ignore[attr-defined]
                 if gpus:
@@ -175,9 +195,20 @@ class Telemetry:
                 # Totally optional, so we just keep None
                 pass
 
-        data["gpu_usage"] = gpu_usage
-        data["gpu_temp"] = gpu_temp
-        data["gpu_mem_used"] = gpu_mem_used
-        data["gpu_mem_total"] = gpu_mem_total
-
-        return data
+        self._last = TelemetrySnap(
+            supported=True,
+            timestamp=now,
+            cpu_total=cpu_total,
+            cpu_per_core=per_core,
+            ram_used=ram_used,
+            ram_total=ram_total,
+            ram_percent=ram_percent,
+            process_count=proc_count,
+            boot_time=boot_time,
+            uptime_sec=max(0.0, now - boot_time),
+            gpu_usage=gpu_usage,
+            gpu_mem_used=gpu_mem_used,
+            gpu_mem_total=gpu_mem_total,
+            gpu_temp=gpu_temp,
+        )
+        return self._last